@@ -243,7 +243,7 @@ async function loadAndPlotChart(chartDiv) {
             
             if (isCacheValid) {
                 // Use cached data if it's still valid
-                chartData = getCachedChartData(divId);
+                chartData = expandColumnarChartData(getCachedChartData(divId));
                 useCache = true;
             }
         } catch (e) {
@@ -251,7 +251,7 @@ async function loadAndPlotChart(chartDiv) {
         }
     } else if (!nbacd_utils.__USE_SERVER_TIMESTAMPS__ && isChartCached(divId)) {
         // Using time-based expiration instead of Last-Modified headers
-        chartData = getCachedChartData(divId);
+        chartData = expandColumnarChartData(getCachedChartData(divId));
         useCache = true;
     }
     
@@ -273,19 +273,21 @@ async function loadAndPlotChart(chartDiv) {
             const contentType = response.headers.get("Content-Type");
             const isGzipped =
                 jsonUrl.endsWith(".gz") || (contentType && contentType.includes("gzip"));
+            let rawChartData;
             if (isGzipped) {
                 // Use the readGzJson utility function
-                chartData = await nbacd_utils.readGzJson(response);
+                rawChartData = await nbacd_utils.readGzJson(response);
             } else {
                 // Regular JSON
-                chartData = await response.json();
+                rawChartData = await response.json();
             }
+            chartData = expandColumnarChartData(rawChartData);
 
             // Validate the required attributes early
             validateChartData(chartData);
             
-            // Cache the data for future use with the Last-Modified header
-            cacheChartData(divId, chartData, lastModified);
+            // Cache the compact data for future use with the Last-Modified header
+            cacheChartData(divId, rawChartData, lastModified);
         } catch (error) {
             // Error loading or validating JSON
             chartContainer.innerHTML = `Error can't find ${divId}.json!`;
@@ -460,6 +462,47 @@ document.addEventListener("DOMContentLoaded", () => {
     });
 });
 
+/**
+ * Rebuilds per-point y_values rows for lines stored in the columnar wire format
+ * ("format": "columnar_v1"), where each point key is a parallel array on the line.
+ * Lines in the older row format are returned unchanged.
+ * @param {object} chartData - The chart data object as read from JSON
+ * @returns {object} Chart data whose lines all have row-oriented y_values
+ */
+function expandColumnarChartData(chartData) {
+    if (!chartData || !Array.isArray(chartData.lines)) {
+        return chartData;
+    }
+
+    const lines = chartData.lines.map((line) => {
+        if (line.format !== "columnar_v1") {
+            return line;
+        }
+
+        // "missing" lists, per key, the points that lack the key, so explicit
+        // nulls are kept while absent keys stay absent
+        const missing = line.missing || {};
+        const columns = line.columns.map((key) => [
+            key,
+            line[key.endsWith("s") ? key : key + "s"],
+            new Set(missing[key] || []),
+        ]);
+        const rows = line.x_values.map((_, index) => {
+            const row = {};
+            for (const [key, values, missingRows] of columns) {
+                if (!missingRows.has(index)) {
+                    row[key] = values[index];
+                }
+            }
+            return row;
+        });
+
+        return { ...line, y_values: rows };
+    });
+
+    return { ...chartData, lines };
+}
+
 /**
  * Validates that the chart data has all required attributes
  * @param {object} chartData - The chart data object to validate
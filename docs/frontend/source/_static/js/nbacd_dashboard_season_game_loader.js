@@ -385,8 +385,11 @@ const nbacd_dashboard_season_game_loader = (() => {
 
             // Process and store point margins at each time point
             // This creates a dictionary mapping time points (from GAME_MINUTES) to point margin data
+            // Seasons written by newer generators only carry the binary form
             this.point_margin_map = get_point_margin_map_from_json(
-                game_data.point_margins
+                game_data.point_margins_bin !== undefined
+                    ? game_data.point_margins_bin
+                    : game_data.point_margins
             );
 
             // Create score stats by minute for backwards compatibility
@@ -466,12 +469,33 @@ const nbacd_dashboard_season_game_loader = (() => {
      * - point_margin is the current point margin at that time
      * - min/max_point_margin track the extremes reached during intervals
      *
-     * @param {Array} point_margins_data - List of strings containing point margin data in compressed format
+     * The binary format (point_margins_bin) is a base64 string of packed
+     * little-endian 7-byte records of (uint8 index, int16 point_margin,
+     * int16 min_point_margin, int16 max_point_margin).
+     *
+     * @param {Array|string} point_margins_data - List of strings in compressed format, or base64 binary records
      * @returns {Object} A dictionary mapping time points (from GAME_MINUTES) to point margin data dictionaries
      */
     function get_point_margin_map_from_json(point_margins_data) {
         // Extract point margins from the JSON data
         const raw_point_margin_map = {};
+
+        if (typeof point_margins_data === "string") {
+            const binary_string = atob(point_margins_data);
+            const bytes = new Uint8Array(binary_string.length);
+            for (let i = 0; i < binary_string.length; i++) {
+                bytes[i] = binary_string.charCodeAt(i);
+            }
+            const view = new DataView(bytes.buffer);
+            for (let offset = 0; offset + 7 <= bytes.length; offset += 7) {
+                raw_point_margin_map[view.getUint8(offset)] = {
+                    point_margin: view.getInt16(offset + 1, true),
+                    min_point_margin: view.getInt16(offset + 3, true),
+                    max_point_margin: view.getInt16(offset + 5, true)
+                };
+            }
+            point_margins_data = [];
+        }
         
         for (const point_margin of point_margins_data) {
             const [index_str, points_string] = point_margin.split("=", 2);
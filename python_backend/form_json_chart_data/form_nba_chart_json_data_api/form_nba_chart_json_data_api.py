@@ -6,6 +6,9 @@ This module provides the primary interface for creating JSON data files for NBA
 It contains the core functions for generating different types of analysis plots based on NBA game data.
 """
 
+# Third-party imports
+import numpy as np
+
 # Local imports
 from form_nba_chart_json_data_season_game_loader import Season, Games
 from form_nba_chart_json_data_plot_primitives import (
@@ -118,63 +121,89 @@ class GameFilter:
         # vs_at_home is just the inverse of for_at_home
         self.vs_at_home = None if self.for_at_home is None else not self.for_at_home
 
-    def is_match(self, game, is_win):
+    def _get_key(self):
+        """Get a tuple of the filter criteria, for equality and hashing."""
+        return (
+            self.for_at_home,
+            self.for_rank,
+            None if self.for_team_abbr is None else tuple(self.for_team_abbr),
+            self.vs_rank,
+            None if self.vs_team_abbr is None else tuple(self.vs_team_abbr),
+        )
+
+    def __eq__(self, other):
+        # Filters with the same criteria are interchangeable, so separately
+        # constructed equal filters share cached per-filter work
+        if not isinstance(other, GameFilter):
+            return NotImplemented
+        return self._get_key() == other._get_key()
+
+    def __hash__(self):
+        return hash(self._get_key())
+
+    def get_mask(self, games, is_win):
         """
-        Check if a game matches the filter criteria.
+        Check which games in a Games collection match the filter criteria.
 
         Parameters:
         -----------
-        game : Game
-            The game to check against the filter
+        games : Games
+            The games to check against the filter
+        is_win : bool
+            Whether the filtered ("for") team is the winning team
 
         Returns:
         --------
-        bool
-            True if game matches all filter criteria, False otherwise
+        numpy.ndarray
+            Boolean array, True for each game row that matches
         """
-        # Determine if the home team won
-        if (game.score_diff > 0 and is_win) or (game.score_diff < 0 and not is_win):
-            for_team_abbr = game.home_team_abbr
-            for_team_rank = game.home_team_rank
-            vs_team_abbr = game.away_team_abbr
-            vs_team_rank = game.away_team_rank
-            for_team_where = "home"
-        elif (game.score_diff < 0 and is_win) or (game.score_diff > 0 and not is_win):
-            for_team_abbr = game.away_team_abbr
-            for_team_rank = game.away_team_rank
-            vs_team_abbr = game.home_team_abbr
-            vs_team_rank = game.home_team_rank
-            for_team_where = "away"
-        else:
-            raise AssertionError
+        columns = games.iter_columns()
+        for_is_home = (columns["score_diff"] > 0) == is_win
+        mask = np.ones(len(for_is_home), dtype=bool)
 
         # Check for_at_home filter if it's specified
-        if self.for_at_home is True and for_team_where != "home":
-            return False
-        elif self.for_at_home is False and for_team_where != "away":
-            return False
-        # Check for_team_abbr filter
-        if self.for_team_abbr and for_team_abbr not in self.for_team_abbr:
-            return False
-
-        # Check vs_team_abbr filter
-        if self.vs_team_abbr and vs_team_abbr not in self.vs_team_abbr:
-            return False
-
-        # Check for_rank filter
-        if self.for_rank:
-            if not self._check_rank(
-                for_team_rank, self.for_rank, game.season.team_count
-            ):
-                return False
+        if self.for_at_home is True:
+            mask &= for_is_home
+        elif self.for_at_home is False:
+            mask &= ~for_is_home
+
+        # Check for_team_abbr and vs_team_abbr filters on the integer team
+        # codes, which compare much faster than the abbreviation strings
+        if self.for_team_abbr:
+            for_team_index = np.where(
+                for_is_home, columns["home_team_index"], columns["away_team_index"]
+            )
+            mask &= np.isin(
+                for_team_index, self._get_team_codes(games, self.for_team_abbr)
+            )
+        if self.vs_team_abbr:
+            vs_team_index = np.where(
+                for_is_home, columns["away_team_index"], columns["home_team_index"]
+            )
+            mask &= np.isin(
+                vs_team_index, self._get_team_codes(games, self.vs_team_abbr)
+            )
 
-        # Check vs_rank filter
+        # Check for_rank and vs_rank filters
+        if self.for_rank:
+            for_team_rank = np.where(
+                for_is_home, columns["home_rank"], columns["away_rank"]
+            )
+            mask &= self._check_rank(
+                for_team_rank, self.for_rank, columns["team_count"]
+            )
         if self.vs_rank:
-            if not self._check_rank(vs_team_rank, self.vs_rank, game.season.team_count):
-                return False
+            vs_team_rank = np.where(
+                for_is_home, columns["away_rank"], columns["home_rank"]
+            )
+            mask &= self._check_rank(vs_team_rank, self.vs_rank, columns["team_count"])
+
+        return mask
 
-        # If all filters passed, the game matches
-        return True
+    @staticmethod
+    def _get_team_codes(games, team_abbrs):
+        """Get the integer codes in games.team_abbrs of the given abbreviations."""
+        return np.flatnonzero(np.isin(games.team_abbrs, team_abbrs))
 
     def _check_rank(self, rank, rank_filter, team_count):
         """
@@ -182,32 +211,33 @@ class GameFilter:
 
         Parameters:
         -----------
-        rank : int
+        rank : int or numpy.ndarray
             The team's rank
         rank_filter : str
             The rank filter ('top_5', 'top_10', 'mid_10', 'bot_10', 'bot_5')
-        team_count : int
+        team_count : int or numpy.ndarray
             Total number of teams in the season
 
         Returns:
         --------
-        bool
+        bool or numpy.ndarray
             True if the rank matches the filter, False otherwise
+            (element-wise for array arguments)
         """
         if rank_filter == "top_5":
-            return 1 <= rank <= 5
+            return (1 <= rank) & (rank <= 5)
         elif rank_filter == "top_10":
-            return 1 <= rank <= 10
+            return (1 <= rank) & (rank <= 10)
         elif rank_filter == "mid_10":
             mid_start = (team_count // 2) - 5
             mid_end = (team_count // 2) + 4
-            return mid_start <= rank <= mid_end
+            return (mid_start <= rank) & (rank <= mid_end)
         elif rank_filter == "bot_10":
-            return team_count - 9 <= rank <= team_count
+            return (team_count - 9 <= rank) & (rank <= team_count)
         elif rank_filter == "bot_5":
-            return team_count - 4 <= rank <= team_count
+            return (team_count - 4 <= rank) & (rank <= team_count)
         else:
-            return False
+            return np.zeros_like(rank, dtype=bool)
 
     def _get_rank_display_name(self, rank_filter):
         """
@@ -441,7 +471,7 @@ def plot_biggest_deficit(
             stop_year_numeric, _ = parse_season_type(stop_year)
 
             # Use the Games class that loads from JSON with optional game filter
-            games = Games(
+            games = Games.load_cached(
                 start_year=start_year_numeric,
                 stop_year=stop_year_numeric,
                 season_type=season_type,
@@ -523,7 +553,7 @@ def plot_biggest_deficit(
         calculate_occurrences=calculate_occurrences,
     )
 
-    final_plot.to_json()
+    final_plot.write_json()
 
     return title, game_years_strings, game_filter_strings
 
@@ -697,7 +727,7 @@ def plot_percent_versus_time(
             stop_year_numeric, _ = parse_season_type(stop_year)
 
             # Use the Games class that loads from JSON with optional game filter
-            games = Games(
+            games = Games.load_cached(
                 start_year=start_year_numeric,
                 stop_year=stop_year_numeric,
                 season_type=season_type,
@@ -828,6 +858,6 @@ def plot_percent_versus_time(
         json_name=json_name,
         lines=percent_lines,
     )
-    final_plot.to_json()
+    final_plot.write_json()
 
     return title, game_years_strings, game_filter_strings
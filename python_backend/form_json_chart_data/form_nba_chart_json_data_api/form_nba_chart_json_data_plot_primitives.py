@@ -8,16 +8,200 @@ points, and complete plots that can be serialized to JSON.
 """
 
 # Standard library imports
+import atexit
+import gzip
 import json
 import os
+import sys
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+
+# Third-party imports
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Local imports
-from form_nba_chart_json_data_season_game_loader import GAME_MINUTES, TIME_TO_INDEX_MAP
+from form_nba_chart_json_data_season_game_loader import (
+    INT8_MAX,
+    INT8_MIN,
+    TIME_TO_INDEX_MAP,
+    time_to_index,
+)
 from form_nba_chart_json_data_num import Num
 
+# Background pool for compressing and writing chart JSON files, so building
+# the next plot overlaps with the gzip and disk work of the previous one
+_IO_POOL = ThreadPoolExecutor(max_workers=4)
+
+
+def _normal_y_ticks(start, stop):
+    """Get (y_ticks, y_tick_labels) for a sigma axis at half-sigma steps."""
+    y_ticks = tuple(Num.arange(start, stop, 0.5))
+    return y_ticks, tuple(f"{p:0.2f}" for p in y_ticks)
+
+
+# Sigma axis ticks for each FinalPlot use_normal_labels mode
+_Y_TICKS = {
+    "max_or_more": _normal_y_ticks(-4.0, 2.0),
+    "at": _normal_y_ticks(-3.5, 4.0),
+    "max": _normal_y_ticks(-4.0, 3.0),
+}
+
+
+def dumps_json(data, pretty=False):
+    """
+    Serialize data to JSON bytes, using orjson when it is installed.
+
+    Parameters:
+    -----------
+    data : object
+        JSON-serializable data (NumPy scalars and arrays are allowed)
+    pretty : bool
+        Indent the output by 2 spaces
+
+    Returns:
+    --------
+    bytes
+        UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        # Non-string keys are stringified, as the json fallback does
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+
+    def numpy_default(obj):
+        if isinstance(obj, (np.generic, np.ndarray)):
+            return obj.tolist()
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+    return json.dumps(
+        data,
+        indent=2 if pretty else None,
+        separators=None if pretty else (",", ":"),
+        default=numpy_default,
+    ).encode("utf-8")
+
+
+def _compress_and_write(json_name, payload):
+    """
+    Write a serialized JSON payload to a gzipped file.
+
+    Parameters:
+    -----------
+    json_name : str
+        Output path (must end in .gz)
+    payload : bytes
+        Serialized JSON
+    """
+    # Make sure the directory exists; it usually does, and a stat is cheaper
+    # than the failing mkdir that makedirs would issue
+    directory = os.path.dirname(json_name)
+    if not os.path.isdir(directory):
+        os.makedirs(directory, exist_ok=True)
+
+    # Compress the whole payload in one call and write it with one syscall,
+    # rather than streaming it through a GzipFile
+    compressed = gzip.compress(payload, compresslevel=6)
+    with open(json_name, "wb") as f:
+        f.write(compressed)
+
+
+def _group_game_ids(game_ids, point_margins, matches):
+    """
+    Group the IDs of the matching games by point margin.
+
+    The games are sorted by point margin with NumPy, so the only Python-level
+    work is one set construction per distinct point margin.
+
+    Parameters:
+    -----------
+    game_ids : list of str
+        Game ID of each row
+    point_margins : numpy.ndarray
+        Point margin of each row
+    matches : numpy.ndarray
+        Boolean mask of the rows to include
+
+    Returns:
+    --------
+    list of tuple
+        (point_margin, set of game IDs) for each distinct point margin of the
+        matching rows, in increasing point margin order
+    """
+    rows = np.flatnonzero(matches)
+    margins = point_margins[rows]
+    order = np.argsort(margins, kind="stable")
+    rows = rows[order].tolist()
+    margins, starts = np.unique(margins[order], return_index=True)
+    bounds = starts.tolist() + [len(rows)]
+    return [
+        (margin, set(map(game_ids.__getitem__, rows[start:stop])))
+        for margin, start, stop in zip(margins.tolist(), bounds, bounds[1:])
+    ]
+
+
+# Version tag for line JSON whose per-point data is stored as parallel arrays
+COLUMNAR_FORMAT = "columnar_v1"
+
+
+def _to_columnar(json_data):
+    """
+    Convert a line's row-oriented y_values into parallel arrays.
+
+    Each per-point key (e.g. "y_value", "percent", "win_games") becomes a
+    top-level array on the line named by its plural ("y_values", "percents",
+    "win_games"), so the points' "x_value" becomes the line's "x_values". The
+    original row keys are listed in "columns" so the frontend can rebuild the
+    rows. A point lacking a key has None in that key's array, and its index
+    is listed under the key in "missing", so the frontend can tell a missing
+    key from an explicit None.
+
+    Parameters:
+    -----------
+    json_data : dict
+        Line JSON with a "y_values" list of per-point dicts
+
+    Returns:
+    --------
+    dict
+        The same dict, rewritten in columnar form
+
+    Raises:
+    -------
+    ValueError
+        If a key's array name is already used by the line
+    """
+    rows = json_data.pop("y_values")
+    row_keys = list(dict.fromkeys(key for row in rows for key in row))
+    json_data["format"] = COLUMNAR_FORMAT
+    json_data["columns"] = row_keys
+    missing = {}
+    for key in row_keys:
+        column_name = key if key.endswith("s") else key + "s"
+        if column_name in json_data:
+            raise ValueError(
+                f"Point key {key!r} collides with line key {column_name!r}"
+            )
+        json_data[column_name] = [row.get(key) for row in rows]
+        missing_rows = [index for index, row in enumerate(rows) if key not in row]
+        if missing_rows:
+            missing[key] = missing_rows
+    if missing:
+        json_data["missing"] = missing
+    return json_data
+
 
 # Define PointMarginPercent class here to avoid circular imports
 class PointMarginPercent:
+    # One is created per game and point margin, so skip the per-instance dict
+    __slots__ = ("wins", "losses")
+
     def __repr__(self):
         odds, win_count, loss_count, game_count = self.odds
         return f"{int(100.0 * (odds or 0.0))}% {win_count}/{loss_count}"
@@ -26,6 +210,12 @@ class PointMarginPercent:
         self.wins = set()
         self.losses = set()
 
+    def copy(self):
+        point_margin_percent = PointMarginPercent()
+        point_margin_percent.wins = self.wins.copy()
+        point_margin_percent.losses = self.losses.copy()
+        return point_margin_percent
+
     @property
     def odds(self):
         try:
@@ -106,6 +296,11 @@ class PointsDownLine(PlotLine):
     min_percent = 1 / 10000000000.0
     max_percent = 1.0 - min_percent
 
+    # Recently built point margin maps keyed by the identity of their inputs,
+    # since plot variants often share games, filter, start_time and down_mode
+    _point_margin_map_cache = {}
+    point_margin_map_cache_size = 32
+
     def __init__(
         self,
         games,
@@ -154,7 +349,7 @@ class PointsDownLine(PlotLine):
 
         self.start_time = start_time
         self.down_mode = down_mode
-        self.point_margin_map = point_margin_map = self.setup_point_margin_map(
+        self.point_margin_map = point_margin_map = self.get_point_margin_map(
             games, game_filter, start_time, down_mode
         )
         x = [(x, y.odds[0])[0] for x, y in sorted(point_margin_map.items())]
@@ -213,6 +408,45 @@ class PointsDownLine(PlotLine):
             all_game_ids.update(data.losses)
         return all_game_ids
 
+    def get_point_margin_map(self, games, game_filter, start_time, down_mode):
+        """
+        Get a copy of the point margin map for the given inputs.
+
+        The map is built by setup_point_margin_map once per combination of
+        inputs and kept in a small cache; callers get a copy since the map is
+        modified while the line is set up. Games are keyed by id, and the
+        cache holds a reference to them so the id stays unique while cached.
+        Game filters are keyed by a snapshot of their criteria, so equal
+        filters share entries and changing a filter's attributes afterwards
+        can't alter a stored key.
+
+        Parameters:
+        -----------
+        games, game_filter, start_time, down_mode
+            See setup_point_margin_map
+
+        Returns:
+        --------
+        dict
+            Dictionary mapping point margins to PointMarginPercent objects
+        """
+        cache = PointsDownLine._point_margin_map_cache
+        filter_key = None if game_filter is None else game_filter._get_key()
+        key = (id(games), filter_key, start_time, down_mode)
+        entry = cache.pop(key, None)
+        if entry is None:
+            point_margin_map = self.setup_point_margin_map(
+                games, game_filter, start_time, down_mode
+            )
+            entry = (games, point_margin_map)
+            if len(cache) >= self.point_margin_map_cache_size:
+                cache.pop(next(iter(cache)))
+        cache[key] = entry  # (Re)insert as the most recently used entry
+        return {
+            point_margin: point_margin_percent.copy()
+            for point_margin, point_margin_percent in entry[1].items()
+        }
+
     def setup_point_margin_map(self, games, game_filter, start_time, down_mode):
         """
         Create a mapping of point margins to win/loss outcomes for analysis.
@@ -250,65 +484,55 @@ class PointsDownLine(PlotLine):
                 f"Invalid start_time: {start_time}, not found in TIME_TO_INDEX_MAP"
             )
 
-        for game in games:
-            if down_mode == "at":
-                # Analyze point deficit at the specific time point
-                sign = 1 if game.score_diff > 0 else -1
-                point_margin = game.point_margin_map[start_time]["point_margin"]
-                win_point_margin = sign * point_margin
-                lose_point_margin = -1 * win_point_margin
-
-            elif down_mode == "max":
-                # Analyze maximum point deficit faced during the period
-                point_margin = game.point_margin_map[start_time]["point_margin"]
-                win_point_margin = float("inf")
-                lose_point_margin = float("inf")
-
-                # Determine the range of time to analyze
-                start_index = TIME_TO_INDEX_MAP[start_time]
-                stop_index = TIME_TO_INDEX_MAP[0]  # End of game
-
-                # Find the maximum deficit throughout the period
-                for index in range(start_index, stop_index + 1):
-                    time = GAME_MINUTES[index]
-                    point_margin_data = game.point_margin_map[time]
-
-                    # For first time point, use the current margin
-                    if index == start_index:
-                        min_point_margin = point_margin_data["point_margin"]
-                        max_point_margin = point_margin_data["point_margin"]
-                    else:
-                        # For subsequent time points, use min/max values
-                        min_point_margin = point_margin_data["min_point_margin"]
-                        max_point_margin = point_margin_data["max_point_margin"]
-
-                    if game.score_diff > 0:  # Home team won
-                        win_point_margin = min(min_point_margin, win_point_margin)
-                        lose_point_margin = min(
-                            -1.0 * max_point_margin, lose_point_margin
-                        )
-                    elif game.score_diff < 0:  # Away team won
-                        win_point_margin = min(
-                            -1.0 * max_point_margin, win_point_margin
-                        )
-                        lose_point_margin = min(min_point_margin, lose_point_margin)
-                    else:
-                        raise AssertionError("NBA games can't end in a tie")
-            else:
-                raise NotImplementedError(f"Unsupported down_mode: {down_mode}")
-
-            # Record the outcomes based on the game filter
-            if game_filter is None or game_filter.is_match(game, is_win=True):
-                win_point_margin_percent = point_margin_map.setdefault(
-                    win_point_margin, PointMarginPercent()
-                )
-                win_point_margin_percent.wins.add(game.game_id)
+        start_index = time_to_index(start_time)
+        stop_index = time_to_index(0)  # End of game
+
+        columns = games.iter_columns()
+        home_won = columns["score_diff"] > 0
+        point_margin = columns["pm"][:, start_index].astype(np.int16)
+
+        if down_mode == "at":
+            # Analyze point deficit at the specific time point
+            win_point_margins = np.where(home_won, point_margin, -point_margin)
+            lose_point_margins = -win_point_margins
+
+        elif down_mode == "max":
+            # Analyze maximum point deficit faced during the period: the
+            # current margin at the first time point, then the min/max
+            # values reached during each later interval
+            later = slice(start_index + 1, stop_index + 1)
+            min_point_margin = np.minimum(
+                point_margin, columns["pm_min"][:, later].min(axis=1, initial=INT8_MAX)
+            )
+            max_point_margin = np.maximum(
+                point_margin, columns["pm_max"][:, later].max(axis=1, initial=INT8_MIN)
+            )
+            if not np.all(columns["score_diff"] != 0):
+                raise AssertionError("NBA games can't end in a tie")
+            win_point_margins = np.where(home_won, min_point_margin, -max_point_margin)
+            lose_point_margins = np.where(home_won, -max_point_margin, min_point_margin)
+        else:
+            raise NotImplementedError(f"Unsupported down_mode: {down_mode}")
 
-            if game_filter is None or game_filter.is_match(game, is_win=False):
-                lose_point_margin_percent = point_margin_map.setdefault(
-                    lose_point_margin, PointMarginPercent()
-                )
-                lose_point_margin_percent.losses.add(game.game_id)
+        # Record the outcomes based on the game filter
+        if game_filter is None:
+            win_matches = lose_matches = np.ones(len(games.game_ids), dtype=bool)
+        else:
+            win_matches = game_filter.get_mask(games, is_win=True)
+            lose_matches = game_filter.get_mask(games, is_win=False)
+
+        win_groups = _group_game_ids(games.game_ids, win_point_margins, win_matches)
+        lose_groups = _group_game_ids(games.game_ids, lose_point_margins, lose_matches)
+        for point_margin, wins in win_groups:
+            win_point_margin_percent = point_margin_map.setdefault(
+                point_margin, PointMarginPercent()
+            )
+            win_point_margin_percent.wins = wins
+        for point_margin, losses in lose_groups:
+            lose_point_margin_percent = point_margin_map.setdefault(
+                point_margin, PointMarginPercent()
+            )
+            lose_point_margin_percent.losses = losses
 
         return point_margin_map
 
@@ -505,12 +729,13 @@ class PointsDownLine(PlotLine):
             "or_less_point_margin": self.or_less_point_margin,
             "or_more_point_margin": self.or_more_point_margin,
         }
-        json_data["x_values"] = list(self.point_margins)
+        # x_values is built from the points' x_value by _to_columnar
         json_data["y_values"] = y_values = []
+        all_game_ids = self.get_all_game_ids()
         for index, point_margin in enumerate(self.point_margins):
             point_margin_json = self.point_margin_map[point_margin].to_json(
                 self.games,
-                self.get_all_game_ids(),
+                all_game_ids,
                 calculate_occurrences,
             )
             point_margin_json["percent"] = self.percents[index]
@@ -518,7 +743,7 @@ class PointsDownLine(PlotLine):
             point_margin_json["y_value"] = self.sigma_final[index]
             point_margin_json["x_value"] = self.point_margins[index]
             y_values.append(point_margin_json)
-        return json_data
+        return _to_columnar(json_data)
 
     def plot_point_raw_margins(self, games):
         # This method is not used in the production code and requires direct
@@ -607,49 +832,55 @@ class PercentLine(PlotLine):
             "number_of_games": self.number_of_games,
         }
 
-        if self.legend == "Record":
-            adjust_y = 0.2
-        else:
-            adjust_y = 0.0
-
-        json_data["x_values"] = self.x_values
+        # x_values is built from the points' x_value by _to_columnar
         json_data["y_values"] = y_values = []
 
-        for index, point in enumerate(self.line_data):
-            if isinstance(point, float):
+        # line_data is homogeneous: floats for theoretical guide lines,
+        # (fit_value, point_margin, PointMarginPercent) tuples for data lines
+        if self.line_data and isinstance(self.line_data[0], float):
+            for x_value, point in zip(self.x_values, self.line_data):
+                y_values.append(
+                    {"x_value": x_value, "y_value": point, "y_fit_value": point}
+                )
+            return _to_columnar(json_data)
+
+        adjust_y = 0.2 if self.legend == "Record" else 0.0
+        all_game_ids = set(self.games.keys())
+        for x_value, point in zip(self.x_values, self.line_data):
+            point_margin_percent = point[-1]
+            if point_margin_percent is None:
                 point_json = {}
-                y_value = y_fit_value = point
             else:
-                point_margin_percent = point[-1]
-                y_value = point[1]
-                y_fit_value = point[0] - adjust_y
-
-                if point_margin_percent is None:
-                    point_json = {}
-                else:
-                    point_json = point_margin_percent.to_json(
-                        self.games, set(self.games.keys()), calculate_occurrences=False
-                    )
-                    if self.legend != "Record":
-                        if "win_games" in point_json:
-                            point_json.pop("win_games")
-                        if "loss_games" in point_json:
-                            point_json.pop("loss_games")
-                        if (
-                            hasattr(point_margin_percent, "odds")
-                            and point_margin_percent.odds
-                        ):
-                            point_json["percent"] = point_margin_percent.odds[0]
-
-            point_json["x_value"] = self.x_values[index]
-            point_json["y_value"] = y_value
-            point_json["y_fit_value"] = y_fit_value
+                point_json = point_margin_percent.to_json(
+                    self.games, all_game_ids, calculate_occurrences=False
+                )
+                if self.legend != "Record":
+                    if "win_games" in point_json:
+                        point_json.pop("win_games")
+                    if "loss_games" in point_json:
+                        point_json.pop("loss_games")
+                    if (
+                        hasattr(point_margin_percent, "odds")
+                        and point_margin_percent.odds
+                    ):
+                        point_json["percent"] = point_margin_percent.odds[0]
+
+            point_json["x_value"] = x_value
+            point_json["y_value"] = point[1]
+            point_json["y_fit_value"] = point[0] - adjust_y
             y_values.append(point_json)
 
-        return json_data
+        return _to_columnar(json_data)
 
 
 class FinalPlot:
+    # Futures for chart JSON files still being written by _IO_POOL
+    _pending_writes = []
+
+    # Indent the output JSON; the frontend doesn't need it, so only enable
+    # it when reading the files by hand
+    pretty = False
+
     def __init__(
         self,
         plot_type,
@@ -674,15 +905,8 @@ class FinalPlot:
         self.x_label = x_label
         self.y_label = ("Win " + "\u03c3") if use_normal_labels else y_label
         # self.x_ticks = x_ticks
-        if use_normal_labels == "max_or_more":
-            y_ticks = list(Num.arange(-4.0, 2.0, 0.5))
-            y_tick_labels = [f"{p:0.2f}" for p in y_ticks]
-        elif use_normal_labels == "at":
-            y_ticks = list(Num.arange(-3.5, 4.0, 0.5))
-            y_tick_labels = [f"{p:0.2f}" for p in y_ticks]
-        elif use_normal_labels == "max":
-            y_ticks = list(Num.arange(-4.0, 3.0, 0.5))
-            y_tick_labels = [f"{p:0.2f}" for p in y_ticks]
+        if use_normal_labels in _Y_TICKS:
+            y_ticks, y_tick_labels = _Y_TICKS[use_normal_labels]
         elif not use_normal_labels:
             pass
         else:
@@ -694,25 +918,72 @@ class FinalPlot:
         self.lines = lines
         self.json_name = json_name
 
-    def to_json(self):
-        json_data = dict(self.__dict__)
-        json_data.pop("json_name")
-        lines = json_data.pop("lines")
+    def to_json_obj(self):
+        """
+        Build the JSON-serializable chart data for the frontend.
 
-        json_data["lines"] = json_lines = []
+        Returns:
+        --------
+        dict
+            Plot settings plus the JSON data of each line
+        """
+        return {
+            "plot_type": self.plot_type,
+            "title": self.title,
+            "min_x": self.min_x,
+            "max_x": self.max_x,
+            "x_label": self.x_label,
+            "y_label": self.y_label,
+            "calculate_occurrences": self.calculate_occurrences,
+            "y_ticks": self.y_ticks,
+            "y_tick_labels": self.y_tick_labels,
+            "lines": [line.to_json(self.calculate_occurrences) for line in self.lines],
+        }
 
-        for line in lines:
-            json_lines.append(line.to_json(self.calculate_occurrences))
+    def write_json(self):
+        """
+        Write the chart data to self.json_name as gzipped JSON.
 
-        # Make sure the directory exists
-        os.makedirs(os.path.dirname(self.json_name), exist_ok=True)
+        A .gz suffix is added to json_name if missing. The data is serialized
+        here and compressed and written on a background thread; call
+        join_all() to wait for the file.
+        """
         if not self.json_name.endswith(".gz"):
             self.json_name = self.json_name + ".gz"
-        if self.json_name.endswith(".gz"):
-            import gzip
 
-            with gzip.open(self.json_name, "wt") as fileobj:
-                fileobj.write(json.dumps(json_data, indent=4))
-        else:
-            with open(self.json_name, "w") as fileobj:
-                fileobj.write(json.dumps(json_data, indent=4))
+        payload = dumps_json(self.to_json_obj(), pretty=self.pretty)
+        FinalPlot._pending_writes.append(
+            _IO_POOL.submit(_compress_and_write, self.json_name, payload)
+        )
+
+    @classmethod
+    def join_all(cls):
+        """
+        Wait for all pending chart JSON writes to finish.
+
+        Re-raises the first error from a failed write.
+        """
+        pending, cls._pending_writes = cls._pending_writes, []
+        for future in pending:
+            future.result()
+
+
+def _join_all_at_exit():
+    """
+    Wait for pending chart JSON writes as the interpreter exits.
+
+    Python only prints an exception raised by an atexit callback and still
+    exits with status 0, so a failed write is reported here and the process
+    exits with status 1 instead.
+    """
+    try:
+        FinalPlot.join_all()
+    except Exception:
+        traceback.print_exc()
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(1)
+
+
+# Surface any failed background writes before the interpreter exits
+atexit.register(_join_all_at_exit)
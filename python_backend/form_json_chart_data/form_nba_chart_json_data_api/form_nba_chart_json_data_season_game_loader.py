@@ -12,9 +12,34 @@ increments) in the final minute of the game.
 """
 
 # Standard library imports
-import json
 import os
-import gzip
+import base64
+import hashlib
+import mmap
+import multiprocessing
+import pickle
+import re
+import struct
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import repeat
+
+# Third-party imports
+import numpy as np
+
+try:
+    # orjson parses the season files several times faster than the stdlib
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+try:
+    # ISA-L inflate decompresses the season files 2-3x faster than zlib
+    from isal.igzip import decompress as gzip_decompress
+except ImportError:
+    from gzip import decompress as gzip_decompress
 
 
 # Defines time intervals for analysis, from start of game (48 minutes)
@@ -69,6 +94,109 @@ GAME_MINUTES = [
 # Mapping from time point to array index for efficient lookup
 TIME_TO_INDEX_MAP = {key: index for index, key in enumerate(GAME_MINUTES)}
 
+# List form of TIME_TO_INDEX_MAP for hot lookups of the whole-minute keys,
+# indexed by minute (-1 where a minute has no time point)
+TIME_INT_TO_INDEX = [-1] * (GAME_MINUTES[0] + 1)
+for _index, _key in enumerate(GAME_MINUTES):
+    if isinstance(_key, int):
+        TIME_INT_TO_INDEX[_key] = _index
+del _index, _key
+
+
+def time_to_index(key):
+    """
+    Get the GAME_MINUTES array index of a time point.
+
+    Accepts the same keys as TIME_TO_INDEX_MAP, including numbers that
+    compare equal to a whole-minute key (e.g. 24.0 or numpy.int64(24)).
+
+    Parameters:
+    -----------
+    key : int or str
+        Time point from GAME_MINUTES
+
+    Returns:
+    --------
+    int
+        Index of the time point in GAME_MINUTES
+
+    Raises:
+    -------
+    KeyError
+        If key is not a time point in GAME_MINUTES
+    """
+    # Plain ints take the list; everything else falls back to the dict
+    if type(key) is int and 0 <= key < len(TIME_INT_TO_INDEX):
+        index = TIME_INT_TO_INDEX[key]
+        if index >= 0:
+            return index
+    return TIME_TO_INDEX_MAP[key]
+
+
+def get_ordinal(n):
+    """Format a positive integer as an ordinal string (1st, 2nd, 3rd, etc.)."""
+    if 10 <= n % 100 <= 20:
+        suffix = "th"
+    else:
+        suffix = {1: "st", 2: "nd", 3: "rd"}.get(n % 10, "th")
+    return f"{n}{suffix}"
+
+
+# Ordinal strings for team ranks; ranks outside this table display as "N/A"
+RANK_ORDINALS = {n: get_ordinal(n) for n in range(1, 100)}
+
+# Binary point margin record: (index, point_margin, min_point_margin,
+# max_point_margin), little-endian and packed, as written to point_margins_bin
+POINT_MARGIN_RECORD = np.dtype(
+    [
+        ("index", "<u1"),
+        ("point_margin", "<i2"),
+        ("min_point_margin", "<i2"),
+        ("max_point_margin", "<i2"),
+    ]
+)
+
+# Matches the value of an "index=value" point margin entry (one without
+# min/max point margins) in a "|"-joined string of entries
+SHORT_POINT_MARGIN_RE = re.compile(r"=(-?\d+)(?=\||$)")
+
+# Matches a season file name written by get_season_filename
+SEASON_FILENAME_RE = re.compile(r"nba_season_(\d+)\.json\.gz")
+
+# Matches a final score string "away_points - home_points" at the start of
+# each line, so one findall parses a newline-joined column of scores
+SCORE_RE = re.compile(r"^(\d+) - (\d+)", re.MULTILINE)
+
+# Season column name for each string field of a game's JSON data
+# (game_season_type, since Games.season_type is the collection's filter)
+GAME_TEXT_COLUMNS = {
+    "game_date": "game_date",
+    "game_season_type": "season_type",
+    "season_year": "season_year",
+    "home_team_abbr": "home_team_abbr",
+    "away_team_abbr": "away_team_abbr",
+    "score": "score",
+}
+
+# W/L label indexed by a 0/1 win flag, for the columnar W/L arrays
+WL_LABELS = np.array(["L", "W"])
+
+# Marks time points with no point margin data before forward-filling
+POINT_MARGIN_SENTINEL = np.iinfo(np.int16).min
+
+# Range of point margins storable in the per-game int8 arrays
+INT8_MIN, INT8_MAX = np.iinfo(np.int8).min, np.iinfo(np.int8).max
+
+
+# Directory for the season columns caches (None disables the caches)
+games_cache_path = os.path.expanduser("~/.cache/nba_cbd")
+
+# Bump when the pickled layout of Season or its columns changes
+GAMES_CACHE_VERSION = 8
+
+# Alignment of out-of-band array buffers in mmap cache files
+MMAP_CACHE_ALIGNMENT = 64
+
 
 class Season:
     """Manages loading of season data from JSON files."""
@@ -79,25 +207,100 @@ class Season:
     def get_season(cls, year):
         """Get a season by year, loading it if necessary."""
         if year not in cls._seasons:
-            cls._seasons[year] = Season(year)
+            cls._seasons[year] = cls.load_or_build_cache(year)
         return cls._seasons[year]
 
+    @classmethod
+    def load_or_build_cache(cls, year):
+        """
+        Load a season from its columns cache, building the cache if stale.
+
+        The columns cache (see get_columns_cache_filename) holds the season
+        metadata plus the parsed columns of all its games in the
+        write_mmap_cache format, so a warm load maps the arrays directly and
+        skips gzip, JSON and point margin parsing entirely. It is rebuilt when
+        the season file is newer or GAMES_CACHE_VERSION has changed.
+
+        Parameters:
+        -----------
+        year : int
+            Season year
+
+        Returns:
+        --------
+        Season
+            The loaded season, with its "all" columns parsed
+        """
+        filename = get_season_filename(year)
+        cache_filename = get_columns_cache_filename(year)
+        if is_cache_fresh(filename, cache_filename):
+            version, season, columns = load_mmap_cache(cache_filename)
+            if version == GAMES_CACHE_VERSION:
+                season._columns["all"] = columns
+                return season
+
+        season = Season(year)
+        columns = season.get_columns("all")
+        if cache_filename:
+            write_mmap_cache(cache_filename, (GAMES_CACHE_VERSION, season, columns))
+        return season
+
+    @classmethod
+    def bulk_load(cls, years):
+        """
+        Load several seasons at once, parsing the season files in parallel.
+
+        Seasons already loaded are skipped, and seasons with a fresh columns
+        cache are loaded in this process since that is cheap. The rest are
+        built by _build_season in worker processes, which also write their
+        caches. Only the season metadata and the compact game columns come
+        back; the raw season dicts, by far the largest part of a parse, never
+        leave the workers, so peak memory here stays at the size of the
+        columns.
+
+        Parameters:
+        -----------
+        years : iterable of int
+            Season years to load
+        """
+        years = [year for year in years if year not in cls._seasons]
+        build_years = [
+            year
+            for year in years
+            if not is_cache_fresh(
+                get_season_filename(year), get_columns_cache_filename(year)
+            )
+        ]
+        max_workers = min(len(build_years), os.cpu_count() or 1)
+        if max_workers > 1:
+            # spawn, since forking is unsafe with the chart writer threads
+            # running or on macOS; callers must guard their __main__ code
+            with ProcessPoolExecutor(
+                max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
+            ) as pool:
+                seasons = pool.map(
+                    _build_season,
+                    build_years,
+                    repeat(json_base_path),
+                    repeat(games_cache_path),
+                )
+                for year, (season, columns) in zip(build_years, seasons):
+                    season._columns["all"] = columns
+                    cls._seasons[year] = season
+
+        for year in years:
+            cls.get_season(year)
+
     def __init__(self, year):
         """Initialize a season by loading its JSON data."""
         self.year = year
-        self.filename = f"{json_base_path}/nba_season_{year}.json.gz"
+        self.filename = get_season_filename(year)
 
         # Verify the file exists
         if not os.path.exists(self.filename):
             raise FileNotFoundError(f"Season data file not found: {self.filename}")
 
-        # Load the season data
-        if self.filename.endswith(".gz"):
-            with gzip.open(self.filename, "rt") as f:  # 'rt' for text mode
-                self.data = json.load(f)
-        else:
-            with open(self.filename, "r") as f:
-                self.data = json.load(f)
+        self.data = _load_raw(self.filename)
 
         # Extract season metadata
         self.season_year = self.data["season_year"]
@@ -105,21 +308,212 @@ class Season:
         self.teams = self.data["teams"]
         self.team_stats = self.data["team_stats"]
 
-        # The games are loaded on demand via the games property
-        self._games = None
+        # (win_pct, rank) per team, so each Game needs one lookup per team;
+        # interned keys make lookups with Game.home/away_team_abbr pointer hits
+        self._team_lookup = {
+            sys.intern(abbr): (float(stats["win_pct"]), int(stats["rank"]))
+            for abbr, stats in self.team_stats.items()
+        }
 
-    @property
-    def games(self):
-        """Lazy load and cache the game objects."""
-        if self._games is None:
-            self._games = {}
-            for game_id, game_data in self.data["games"].items():
-                self._games[game_id] = Game(game_data, game_id, self)
-        return self._games
+        # "ABBR(rank/win_pct)" display string per team for game summaries
+        self._team_summary = {
+            abbr: f"{abbr}({RANK_ORDINALS.get(rank, 'N/A')}/{win_pct:.3f})"
+            for abbr, (win_pct, rank) in self._team_lookup.items()
+        }
+
+        # The game columns are parsed on demand, cached per season_type
+        self._columns = {}
+
+    def __getstate__(self):
+        """Pickle season metadata only; game data is reloaded on demand."""
+        state = dict(self.__dict__)
+        state["data"] = None
+        state["_columns"] = {}
+        return state
+
+    def __setstate__(self, state):
+        """Restore pickled season metadata; unpickled strings aren't interned."""
+        for name in ("_team_lookup", "_team_summary"):
+            state[name] = {
+                sys.intern(abbr): value for abbr, value in state[name].items()
+            }
+        self.__dict__.update(state)
+
+    def get_columns(self, season_type="all"):
+        """
+        Lazy parse and cache the per-game columns for a season type.
+
+        Only games of the requested season_type are parsed; if all games were
+        already parsed, their columns are filtered instead. Once all games are
+        parsed the raw JSON data is released, since every later request can
+        be served from the cached columns.
+
+        Parameters:
+        -----------
+        season_type : str
+            'Regular Season', 'Playoffs', or 'all'
+
+        Returns:
+        --------
+        dict
+            Maps each name in Games.SEASON_COLUMN_NAMES to an array with one
+            row per game, in season file order
+        """
+        if season_type not in self._columns:
+            if "all" in self._columns:
+                all_columns = self._columns["all"]
+                mask = all_columns["game_season_type"] == season_type
+                self._columns[season_type] = {
+                    name: column[mask] for name, column in all_columns.items()
+                }
+            else:
+                self._columns[season_type] = self._parse_columns(season_type)
+                if season_type == "all":
+                    self.data = None
+        return self._columns[season_type]
+
+    def _parse_columns(self, season_type):
+        """
+        Parse the games of a season type from the raw JSON data into columns.
+
+        Games are filtered on the raw JSON data before parsing, so filtered-out
+        games never have their point margins parsed.
+
+        Parameters:
+        -----------
+        season_type : str
+            'Regular Season', 'Playoffs', or 'all'
+
+        Returns:
+        --------
+        dict
+            See get_columns
+        """
+        if self.data is None:
+            self.data = _load_raw(self.filename)
+
+        game_ids = []
+        text_columns = {name: [] for name in GAME_TEXT_COLUMNS}
+        point_margins_data = []
+        for game_id, game_data in self.data["games"].items():
+            if season_type != "all" and game_data["season_type"] != season_type:
+                continue
+            game_ids.append(game_id)
+            for name, values in text_columns.items():
+                values.append(game_data[GAME_TEXT_COLUMNS[name]])
+            # Seasons written by newer generators only carry the binary form
+            point_margins_data.append(
+                game_data.get("point_margins_bin") or game_data["point_margins"]
+            )
+
+        number_of_games = len(game_ids)
+        columns = {"game_id": np.array(game_ids, dtype=str)}
+        for name, values in text_columns.items():
+            columns[name] = np.array(values, dtype=str)
+
+        # Final scores are "away - home", parsed for every game in one pass
+        scores = text_columns["score"]
+        final_scores = SCORE_RE.findall("\n".join(scores))
+        if len(final_scores) != number_of_games:
+            raise ValueError(f"Invalid final score in {self.filename}")
+        final_scores = np.array(final_scores, dtype=np.int16).reshape(-1, 2)
+        columns["final_away_points"] = final_scores[:, 0]
+        columns["final_home_points"] = final_scores[:, 1]
+        # Positive means home team won
+        columns["score_diff"] = final_scores[:, 1] - final_scores[:, 0]
+
+        # Team win percentages and rankings from season data, looked up once
+        # per team and then gathered for every game
+        for where in ("home", "away"):
+            abbrs, team_indices = np.unique(
+                columns[f"{where}_team_abbr"], return_inverse=True
+            )
+            team_lookups = [self._team_lookup[abbr] for abbr in abbrs.tolist()]
+            columns[f"{where}_win_pct"] = np.array(
+                [win_pct for win_pct, _ in team_lookups], np.float64
+            )[team_indices]
+            columns[f"{where}_rank"] = np.array(
+                [rank for _, rank in team_lookups], np.int8
+            )[team_indices]
+        columns["team_count"] = np.full(number_of_games, self.team_count, np.int8)
+
+        # Point margins at each time point, one (pm, pm_min, pm_max) per game
+        point_margins = get_point_margins_from_json(point_margins_data)
+        columns["pm"] = np.ascontiguousarray(point_margins[:, 0])
+        columns["pm_min"] = np.ascontiguousarray(point_margins[:, 1])
+        columns["pm_max"] = np.ascontiguousarray(point_margins[:, 2])
+        return columns
 
 
 class Games:
-    """Collection of NBA games for specified seasons loaded from JSON files."""
+    """
+    Collection of NBA games for specified seasons loaded from JSON files.
+
+    The games are stored column-wise: row i of every column in COLUMN_NAMES
+    is the game game_ids[i]. Indexing or iterating yields lightweight Game
+    views over a row.
+    """
+
+    # Per-game columns parsed by Season.get_columns
+    SEASON_COLUMN_NAMES = (
+        "game_id",
+        "game_date",
+        "game_season_type",
+        "season_year",
+        "home_team_abbr",
+        "away_team_abbr",
+        "score",
+        "final_home_points",
+        "final_away_points",
+        "score_diff",
+        "home_win_pct",
+        "away_win_pct",
+        "home_rank",
+        "away_rank",
+        "team_count",
+        "pm",
+        "pm_min",
+        "pm_max",
+    )
+
+    # All per-game NumPy columns, one row per game
+    COLUMN_NAMES = SEASON_COLUMN_NAMES + (
+        "season_index",
+        "wl_home",
+        "wl_away",
+        "home_team_index",
+        "away_team_index",
+    )
+
+    _loaded = {}  # Class-level cache of collections built by load_cached
+
+    @classmethod
+    def load_cached(cls, start_year, stop_year, season_type="all"):
+        """
+        Get a games collection, reusing one already built in this process.
+
+        Plot functions build the same collection once per game filter, so
+        repeat requests return the first collection instead of building the
+        columns again.
+
+        Parameters:
+        -----------
+        start_year : int
+            First season year to include
+        stop_year : int
+            Last season year to include
+        season_type : str
+            'Regular Season', 'Playoffs', or 'all'
+
+        Returns:
+        --------
+        Games
+            The games collection
+        """
+        key = (start_year, stop_year, season_type)
+        if key not in cls._loaded:
+            cls._loaded[key] = cls(start_year, stop_year, season_type)
+        return cls._loaded[key]
 
     def __init__(self, start_year, stop_year, season_type="all"):
         """
@@ -131,35 +525,93 @@ class Games:
             First season year to include
         stop_year : int
             Last season year to include
-        game_filter : GameFilter or None
-            Filter to apply to games. If None, all games in the date range are included.
+        season_type : str
+            'Regular Season', 'Playoffs', or 'all'
         """
-        self.games = {}
         self.start_year = start_year
         self.stop_year = stop_year
 
         self.season_type = season_type
 
-        # Load all games from the date range
-        for year in range(start_year, stop_year + 1):
-            season = Season.get_season(year)
+        # Load all seasons from the date range
+        Season.bulk_load(range(start_year, stop_year + 1))
+        self.seasons = [
+            Season.get_season(year) for year in range(start_year, stop_year + 1)
+        ]
+
+        self._build_columns()
+
+    def _build_columns(self):
+        """
+        Build the per-game NumPy columns from the seasons' columns.
+
+        Row i of every column corresponds to game_ids[i], so analyses can scan
+        a single contiguous array instead of walking Game objects. The point
+        margin columns (pm, pm_min, pm_max) have shape
+        (number_of_games, len(GAME_MINUTES)).
+        """
+        season_columns = [
+            season.get_columns(self.season_type) for season in self.seasons
+        ]
+        for name in self.SEASON_COLUMN_NAMES:
+            column = np.concatenate([columns[name] for columns in season_columns])
+            setattr(self, name, column)
+        self.season_index = np.repeat(
+            np.arange(len(self.seasons), dtype=np.int8),
+            [len(columns["game_id"]) for columns in season_columns],
+        )
+        self.game_ids = self.game_id.tolist()
+        self._rows = {game_id: row for row, game_id in enumerate(self.game_ids)}
+
+        # NBA games can't end in a tie, so the sign of score_diff decides W/L
+        if not np.all(self.score_diff != 0):
+            raise AssertionError("NBA games can't end in a tie")
+        home_win = (self.score_diff > 0).view(np.int8)
+        self.wl_home = WL_LABELS[home_win]
+        self.wl_away = WL_LABELS[1 - home_win]
+
+        # Integer team codes: team_abbrs[home_team_index[i]] == home_team_abbr[i]
+        number_of_games = len(self.game_ids)
+        self.team_abbrs, team_index = np.unique(
+            np.concatenate([self.home_team_abbr, self.away_team_abbr]),
+            return_inverse=True,
+        )
+        self.home_team_index = team_index[:number_of_games].astype(np.int8)
+        self.away_team_index = team_index[number_of_games:].astype(np.int8)
 
-            for game_id, game in season.games.items():
-                if season_type != "all" and game.season_type != season_type:
-                    continue
-                self.games[game_id] = game
+        # One shared interned str per team for the Game views to hand out
+        self.team_names = tuple(sys.intern(abbr) for abbr in self.team_abbrs.tolist())
+
+    def iter_columns(self):
+        """
+        Get the per-game columns as a dict of NumPy arrays.
+
+        Returns:
+        --------
+        dict
+            Maps each name in COLUMN_NAMES to its array; row i of every
+            array is the game self.game_ids[i]
+        """
+        return {name: getattr(self, name) for name in self.COLUMN_NAMES}
+
+    @property
+    def games(self):
+        """Dictionary mapping game IDs to Game views, built on each access."""
+        return dict(zip(self.game_ids, self))
 
     def __getitem__(self, game_id):
-        return self.games[game_id]
+        return Game(self, self._rows[game_id])
 
     def __len__(self):
-        return len(self.games)
+        return len(self.game_ids)
 
     def __iter__(self):
-        return self.games.values().__iter__()
+        # map drives the Game views from C instead of a generator frame
+        number_of_games = len(self.game_ids)
+        return map(Game, repeat(self, number_of_games), range(number_of_games))
 
     def keys(self):
-        return self.games.keys()
+        return self._rows.keys()
 
     def get_years_string(self):
         """Format the years string for display."""
@@ -181,121 +633,497 @@ class Games:
             )
 
 
+def _column_property(name, convert, doc):
+    """Make a Game property reading the Game's row of a Games column."""
+
+    def get(self):
+        return convert(getattr(self.games, name)[self.row])
+
+    return property(get, doc=doc)
+
+
+def _row_property(name, doc):
+    """Make a Game property returning the Game's row of a 2D Games column."""
+
+    def get(self):
+        return getattr(self.games, name)[self.row]
+
+    return property(get, doc=doc)
+
+
+@dataclass(slots=True)
 class Game:
     """
     Represents a single NBA game with all related statistics.
 
-    Each Game object contains metadata about the game (teams, date, etc.)
-    and a structured mapping of point margins at different times throughout
-    the game, enabling detailed analysis of game progression and comebacks.
+    A Game is a lightweight view of one row of a Games collection: it holds
+    only the collection and the row index, and reads metadata about the game
+    (teams, date, etc.) and its point margins at each time point (pm, pm_min
+    and pm_max, indexed like GAME_MINUTES) from the collection's columns.
     """
 
-    index = 0  # Class variable to track game index
+    games: "Games"
+    row: int
+
+    game_date = _column_property("game_date", str, "Game date (YYYY-MM-DD)")
+    season_type = _column_property(
+        "game_season_type", str, "'Regular Season' or 'Playoffs'"
+    )
+    season_year = _column_property("season_year", str, "Season, e.g. '2017-18'")
+    score = _column_property("score", str, "Final score as 'away - home'")
+    final_home_points = _column_property("final_home_points", int, "Home points")
+    final_away_points = _column_property("final_away_points", int, "Away points")
+    score_diff = _column_property(
+        "score_diff", int, "Home minus away points (positive means home team won)"
+    )
+    wl_home = _column_property("wl_home", str, "'W' or 'L' for the home team")
+    wl_away = _column_property("wl_away", str, "'W' or 'L' for the away team")
+    home_team_win_pct = _column_property("home_win_pct", float, "Home team win %")
+    away_team_win_pct = _column_property("away_win_pct", float, "Away team win %")
+    home_team_rank = _column_property("home_rank", int, "Home team season rank")
+    away_team_rank = _column_property("away_rank", int, "Away team season rank")
+    pm = _row_property("pm", "Point margin at each time point")
+    pm_min = _row_property("pm_min", "Minimum point margin in each interval")
+    pm_max = _row_property("pm_max", "Maximum point margin in each interval")
+
+    @property
+    def game_id(self):
+        """Unique identifier for the game."""
+        return self.games.game_ids[self.row]
+
+    @property
+    def season(self):
+        """The Season this game belongs to."""
+        return self.games.seasons[self.games.season_index[self.row]]
+
+    @property
+    def home_team_abbr(self):
+        """Home team abbreviation."""
+        return self.games.team_names[self.games.home_team_index[self.row]]
+
+    @property
+    def away_team_abbr(self):
+        """Away team abbreviation."""
+        return self.games.team_names[self.games.away_team_index[self.row]]
 
-    def __init__(self, game_data, game_id, season):
+    def point_margin_at(self, key):
         """
-        Initialize game with data from JSON.
+        Get the point margin data for a time point as a dictionary.
 
         Parameters:
         -----------
-        game_data : dict
-            Raw game data from JSON
-        game_id : str
-            Unique identifier for the game
-        season : Season
-            Reference to the Season object this game belongs to
-        """
-        self.index = Game.index
-        Game.index += 1
-
-        # Store the game ID and reference to season
-        self.game_id = game_id
-        self.season = season
-
-        # Copy basic properties
-        self.game_date = game_data["game_date"]
-        self.season_type = game_data["season_type"]
-        self.season_year = game_data["season_year"]
-        self.home_team_abbr = game_data["home_team_abbr"]
-        self.away_team_abbr = game_data["away_team_abbr"]
-        self.score = game_data["score"]
-
-        # Parse final score
-        self.final_away_points, self.final_home_points = [
-            int(x) for x in self.score.split(" - ")
-        ]
+        key : int or str
+            Time point from GAME_MINUTES
 
-        # Calculate point differential (positive means home team won)
-        self.score_diff = int(self.final_home_points) - int(self.final_away_points)
+        Returns:
+        --------
+        dict
+            Dictionary with 'point_margin', 'min_point_margin', and
+            'max_point_margin' keys
+        """
+        index = time_to_index(key)
+        return {
+            "point_margin": int(self.pm[index]),
+            "min_point_margin": int(self.pm_min[index]),
+            "max_point_margin": int(self.pm_max[index]),
+        }
 
-        # Determine win/loss
-        if self.score_diff > 0:
-            self.wl_home = "W"
-            self.wl_away = "L"
-        elif self.score_diff < 0:
-            self.wl_home = "L"
-            self.wl_away = "W"
-        else:
-            raise AssertionError("NBA games can't end in a tie")
+    @property
+    def point_margin_map(self):
+        """
+        Legacy dict view of the point margins, built on each access.
 
-        # Process and store point margins at each time point
-        # This creates a dictionary mapping time points (from GAME_MINUTES) to point margin data
-        self.point_margin_map = get_point_margin_map_from_json(
-            game_data["point_margins"]
-        )
+        Prefer pm/pm_min/pm_max or point_margin_at in new code; this exists
+        for callers written against the old dict-of-dicts layout.
 
-        # Set team win percentages and rankings from season data
-        self.home_team_win_pct = season.team_stats[self.home_team_abbr]["win_pct"]
-        self.away_team_win_pct = season.team_stats[self.away_team_abbr]["win_pct"]
-        self.home_team_rank = season.team_stats[self.home_team_abbr]["rank"]
-        self.away_team_rank = season.team_stats[self.away_team_abbr]["rank"]
+        Returns:
+        --------
+        dict
+            Maps each GAME_MINUTES time point to a point_margin_at dictionary
+        """
+        return {key: self.point_margin_at(key) for key in GAME_MINUTES}
 
     def get_game_summary_json_string(self):
         """Returns a formatted string summary of the game suitable for JSON display."""
-
-        # Format the rank as ordinal (1st, 2nd, 3rd, etc.)
-        def ordinal(n):
-            if 10 <= n % 100 <= 20:
-                suffix = "th"
-            else:
-                suffix = {1: "st", 2: "nd", 3: "rd"}.get(n % 10, "th")
-            return f"{n}{suffix}"
-
-        # Get team ranks from season data
-        home_rank = self.home_team_rank
-        away_rank = self.away_team_rank
-
-        # Format the ranks as ordinals
-        home_rank_str = ordinal(home_rank) if home_rank > 0 else "N/A"
-        away_rank_str = ordinal(away_rank) if away_rank > 0 else "N/A"
+        # Team "ABBR(rank/win_pct)" strings are precomputed once per season
+        team_summary = self.season._team_summary
 
         # Return the formatted string without W/L indicators
         return (
-            f"{self.away_team_abbr}"
-            f"({away_rank_str}/{self.away_team_win_pct:.3f}) @ "
-            f"{self.home_team_abbr}"
-            f"({home_rank_str}/{self.home_team_win_pct:.3f})"
+            f"{team_summary[self.away_team_abbr]} @ "
+            f"{team_summary[self.home_team_abbr]}"
             f": {self.final_away_points}-{self.final_home_points}"
         )
 
 
-def get_point_margin_map_from_json(point_margins_data):
+def _build_season(year, base_path, cache_path):
     """
-    Process point margins from JSON data into a structured map.
+    Build a season and its columns cache in a Season.bulk_load worker.
 
-    Converts the compact string representation of point margins from the JSON data
-    into a structured dictionary mapping time points to point margin data.
+    The worker imports this module afresh, so the calling process's
+    json_base_path and games_cache_path are passed in and set here.
+
+    Returns:
+    --------
+    tuple
+        (season, columns): the season (pickled without its columns) and its
+        "all" columns
+    """
+    global json_base_path, games_cache_path
+    json_base_path, games_cache_path = base_path, cache_path
+    season = Season.load_or_build_cache(year)
+    return season, season.get_columns("all")
+
+
+def get_season_filename(year):
+    """Get the path of the JSON data file for a season year."""
+    return f"{json_base_path}/nba_season_{year}.json.gz"
+
+
+def warm_season_caches():
+    """
+    Load every season file under json_base_path, writing its caches.
+
+    Run once before starting chart scripts in parallel, so the scripts all
+    load seasons from the columns caches instead of each parsing the same
+    season files.
+    """
+    # scandir's entries carry the file type, so filtering costs no extra stat
+    with os.scandir(json_base_path) as entries:
+        matches = [
+            SEASON_FILENAME_RE.fullmatch(entry.name)
+            for entry in entries
+            if entry.is_file()
+        ]
+    Season.bulk_load(sorted(int(match.group(1)) for match in matches if match))
+
+
+def get_columns_cache_filename(year):
+    """
+    Get the path of the columns cache file for a season year.
+
+    The cache lives under games_cache_path rather than next to the season
+    file, which sits in the Sphinx static tree and would be published with
+    it. The name hashes the season file's absolute path, so season
+    directories with the same years don't share a cache file.
+
+    Returns:
+    --------
+    str or None
+        Cache file path, or None if caching is disabled
+    """
+    if games_cache_path is None:
+        return None
+    filename = os.path.abspath(get_season_filename(year))
+    digest = hashlib.md5(filename.encode("utf-8")).hexdigest()
+    return os.path.join(
+        games_cache_path, "seasons", f"nba_season_{year}_{digest}.columns.mmap"
+    )
+
+
+def _load_raw(filename):
+    """
+    Load the raw season data dictionary from a season file.
+
+    Parameters:
+    -----------
+    filename : str
+        Path of the season JSON file
+
+    Returns:
+    --------
+    dict
+        The parsed season data
+    """
+    # Read the whole file and inflate it in one call rather than through
+    # the small reads of a streaming gzip file object
+    raw = read_file(filename)
+    if filename.endswith(".gz"):
+        raw = gzip_decompress(raw)
+    return json_loads(raw)
+
+
+def read_file(filename):
+    """
+    Read a whole file, hinting the kernel that it is read front to back.
+
+    The hint lets a cold page cache read ahead aggressively instead of
+    fetching the file in small random-looking chunks; it is a no-op on
+    platforms without posix_fadvise.
+    """
+    with open(filename, "rb") as f:
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        return f.read()
+
+
+def is_cache_fresh(filename, cache_filename):
+    """Check whether a cache file exists and is newer than its source file."""
+    if cache_filename is None:
+        return False
+    return os.path.exists(cache_filename) and os.path.getmtime(
+        cache_filename
+    ) > os.path.getmtime(filename)
+
+
+def write_mmap_cache(cache_filename, data):
+    """
+    Write data to a cache file that load_mmap_cache can map without copying.
+
+    The data is pickled with protocol 5 so numpy arrays are stored as raw
+    out-of-band buffers instead of inside the pickle stream. The file holds
+    the pickle payload, then each buffer aligned to MMAP_CACHE_ALIGNMENT,
+    then a pickled trailer of (payload_size, [(offset, size), ...]) followed
+    by the trailer length as a little-endian uint64.
+
+    Parameters:
+    -----------
+    cache_filename : str
+        Path of the cache file
+    data : object
+        Picklable data to store
+    """
+    buffers = []
+    payload = pickle.dumps(data, protocol=5, buffer_callback=buffers.append)
+
+    chunks = [payload]
+    position = len(payload)
+    buffer_spans = []
+    for buffer in buffers:
+        raw = buffer.raw()
+        padding = -position % MMAP_CACHE_ALIGNMENT
+        chunks.extend((bytes(padding), raw))
+        buffer_spans.append((position + padding, raw.nbytes))
+        position += padding + raw.nbytes
+
+    trailer = pickle.dumps((len(payload), buffer_spans))
+    chunks.extend((trailer, struct.pack("<Q", len(trailer))))
+    write_cache_file(cache_filename, chunks)
+
+
+def load_mmap_cache(cache_filename):
+    """
+    Load data written by write_mmap_cache.
 
-    The input format is a list of strings with format "index=value" or
-    "index=point_margin,min_point_margin,max_point_margin" where:
+    The file is memory-mapped read-only and numpy arrays are rebuilt directly
+    on the mapped pages, so processes loading the same cache share physical
+    memory through the page cache instead of each holding a private copy.
+    The returned arrays are read-only.
+
+    Parameters:
+    -----------
+    cache_filename : str
+        Path of the cache file
+
+    Returns:
+    --------
+    object
+        The unpickled data
+    """
+    with open(cache_filename, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    # Nearly every mapped page is read by the analyses, so ask for them up
+    # front rather than faulting them in one at a time
+    if hasattr(mmap, "MADV_WILLNEED"):
+        mapped.madvise(mmap.MADV_WILLNEED)
+    view = memoryview(mapped)
+    (trailer_size,) = struct.unpack_from("<Q", view, len(view) - 8)
+    payload_size, buffer_spans = pickle.loads(
+        view[len(view) - 8 - trailer_size : len(view) - 8]
+    )
+    buffers = [view[offset : offset + size] for offset, size in buffer_spans]
+    return pickle.loads(view[:payload_size], buffers=buffers)
+
+
+def write_cache_file(cache_filename, chunks):
+    """
+    Atomically write a cache file from a list of byte chunks.
+
+    The chunks are written to a temporary file in the same directory (created
+    if missing) and then renamed into place, so a concurrent reader never sees
+    a partial file.
+    Failing to write the cache (e.g. a read-only directory) is not an error;
+    the data is simply re-parsed on the next run.
+
+    Parameters:
+    -----------
+    cache_filename : str
+        Path of the cache file
+    chunks : list of bytes-like
+        File contents
+    """
+    cache_dir = os.path.dirname(cache_filename)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, temp_filename = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.writelines(chunks)
+        os.replace(temp_filename, cache_filename)
+    except OSError:
+        if os.path.exists(temp_filename):
+            os.remove(temp_filename)
+
+
+def get_point_margins_from_json(games_point_margins_data):
+    """
+    Parse the point margins of many games into one dense array.
+
+    The legacy input format per game is a list of strings with format
+    "index=value" or "index=point_margin,min_point_margin,max_point_margin"
+    where:
     - index corresponds to positions in the GAME_MINUTES array
     - point_margin is the current point margin at that time
     - min/max_point_margin track the extremes reached during intervals
 
+    The binary format (point_margins_bin) is a base64 string of packed
+    POINT_MARGIN_RECORD records holding the same values.
+
+    The entries of all games are parsed at once by _get_point_margin_entries
+    and scattered into the array with one NumPy assignment. Time points
+    missing from the data are forward-filled with the last known point margin
+    (for all three values) using NumPy index accumulation over every game at
+    once, so no per-game array work is done.
+
+    Parameters:
+    -----------
+    games_point_margins_data : list of list or list of str
+        Point margin data for each game, all in the legacy format or all in
+        the binary format
+
+    Returns:
+    --------
+    numpy.ndarray
+        int8 array of shape (games, 3, len(GAME_MINUTES)) holding each game's
+        point margins, min point margins and max point margins, indexed like
+        GAME_MINUTES
+
+    Raises:
+    -------
+    ValueError
+        If the data is malformed or a point margin does not fit in an int8
+    """
+    number_of_times = len(GAME_MINUTES)
+
+    entries, entry_counts = _get_point_margin_entries(games_point_margins_data)
+    if ((entries[:, 0] < 0) | (entries[:, 0] >= number_of_times)).any():
+        raise ValueError("Point margin time index out of range")
+    number_of_games = len(entry_counts)
+    game_rows = np.repeat(np.arange(number_of_games), entry_counts)
+    margins = np.full(
+        (number_of_games, 3, number_of_times), POINT_MARGIN_SENTINEL, np.int32
+    )
+    margins[game_rows, :, entries[:, 0]] = entries[:, 1:]
+
+    # Forward-fill missing time points with the last known point margin
+    is_present = margins[:, 0] != POINT_MARGIN_SENTINEL
+    if not is_present[:, 0].all():
+        raise AssertionError("Point margin data missing for start of game")
+    if not is_present.all():
+        fill_index = np.maximum.accumulate(
+            np.where(is_present, np.arange(number_of_times), 0), axis=1
+        )
+        point_margins = np.take_along_axis(margins[:, 0], fill_index, axis=1)
+        margins = np.where(is_present[:, None], margins, point_margins[:, None])
+
+    # Point margins are stored as int8
+    out_of_range = ((margins < INT8_MIN) | (margins > INT8_MAX)).any(axis=(1, 2))
+    if out_of_range.any():
+        point_margins_data = games_point_margins_data[int(out_of_range.argmax())]
+        raise ValueError(f"Point margin out of int8 range: {point_margins_data}")
+
+    return margins.astype(np.int8)
+
+
+def _get_point_margin_entries(games_point_margins_data):
+    """
+    Parse the point margin entries of many games in one pass.
+
+    Binary data is base64-decoded per game and read with a single
+    np.frombuffer call over the joined records. Legacy data is joined into
+    one string, "index=value" entries are expanded to "index=value,value,value"
+    with a single regex substitution, and NumPy parses every integer in one
+    call.
+
+    Parameters:
+    -----------
+    games_point_margins_data : list of list or list of str
+        See get_point_margins_from_json
+
+    Returns:
+    --------
+    tuple
+        (entries, entry_counts): an int32 array with one (index, point_margin,
+        min_point_margin, max_point_margin) row per entry, in game order, and
+        the number of entries of each game. int32 so out of range values are
+        caught by the caller instead of wrapping.
+
+    Raises:
+    -------
+    ValueError
+        If the data is malformed
+    """
+    if games_point_margins_data and isinstance(games_point_margins_data[0], str):
+        blobs = [base64.b64decode(data) for data in games_point_margins_data]
+        entry_counts = [len(blob) // POINT_MARGIN_RECORD.itemsize for blob in blobs]
+        records = b"".join(blobs)
+        if len(records) != POINT_MARGIN_RECORD.itemsize * sum(entry_counts):
+            raise ValueError("Invalid binary point margin data")
+        records = np.frombuffer(records, POINT_MARGIN_RECORD)
+        entries = np.stack(
+            [records[name] for name in POINT_MARGIN_RECORD.names], axis=1
+        ).astype(np.int32)
+        return entries, entry_counts
+
+    # "index=value" entries use the value for all three point margins
+    entry_counts = []
+    game_texts = []
+    for point_margins_data in games_point_margins_data:
+        entry_counts.append(len(point_margins_data))
+        game_texts.append("|".join(point_margins_data))
+    text = SHORT_POINT_MARGIN_RE.sub(r"=\1,\1,\1", "|".join(game_texts))
+    entries = np.fromstring(
+        text.replace("=", ",").replace("|", ","), dtype=np.int32, sep=","
+    )
+    if entries.size != 4 * sum(entry_counts):
+        raise ValueError("Invalid point margin data")
+    return entries.reshape(-1, 4), entry_counts
+
+
+def get_point_margin_arrays_from_json(point_margins_data):
+    """
+    Parse one game's point margins from JSON data into dense arrays.
+
+    See get_point_margins_from_json for the input format.
+
     Parameters:
     -----------
-    point_margins_data : list
-        List of strings containing point margin data in compressed format
+    point_margins_data : list or str
+        Point margin data in the legacy or binary format
+
+    Returns:
+    --------
+    tuple
+        (point_margins, min_point_margins, max_point_margins), each an int8
+        array of length len(GAME_MINUTES) indexed like GAME_MINUTES
+    """
+    return tuple(get_point_margins_from_json([point_margins_data])[0])
+
+
+def get_point_margin_map_from_json(point_margins_data):
+    """
+    Process point margins from JSON data into a structured map.
+
+    Converts the compact string representation of point margins from the JSON data
+    into a structured dictionary mapping time points to point margin data.
+    See get_point_margins_from_json for the input format.
+
+    Parameters:
+    -----------
+    point_margins_data : list or str
+        Point margin data in the legacy or binary format
 
     Returns:
     --------
@@ -303,38 +1131,19 @@ def get_point_margin_map_from_json(point_margins_data):
         A dictionary mapping time points (from GAME_MINUTES) to point margin data dictionaries
         containing 'point_margin', 'min_point_margin', and 'max_point_margin' keys
     """
-    # Extract point margins from the JSON data
-    raw_point_margin_map = {}
-    for point_margin in point_margins_data:
-        index, points_string = point_margin.split("=", 1)
-        if "," in points_string:
-            point_margin, min_point_margin, max_point_margin = [
-                int(x) for x in points_string.split(",")
-            ]
-        else:
-            point_margin = min_point_margin = max_point_margin = int(points_string)
-        raw_point_margin_map[int(index)] = {
+    point_margins, min_point_margins, max_point_margins = (
+        get_point_margin_arrays_from_json(point_margins_data)
+    )
+    return {
+        key: {
             "point_margin": point_margin,
             "min_point_margin": min_point_margin,
             "max_point_margin": max_point_margin,
         }
-
-    # Create a complete mapping for all time points in GAME_MINUTES
-    point_margin_map = {}
-    last_point_margin = None
-    for index in range(len(GAME_MINUTES)):
-        key = GAME_MINUTES[index]
-        try:
-            point_margin_data = raw_point_margin_map[index]
-        except KeyError:
-            # If data is missing for this time point, use the last known point margin
-            if last_point_margin is None:
-                raise AssertionError
-            point_margin_data = {
-                "point_margin": last_point_margin,
-                "min_point_margin": last_point_margin,
-                "max_point_margin": last_point_margin,
-            }
-        point_margin_map[key] = point_margin_data
-        last_point_margin = point_margin_data["point_margin"]
-    return point_margin_map
+        for key, point_margin, min_point_margin, max_point_margin in zip(
+            GAME_MINUTES,
+            point_margins.tolist(),
+            min_point_margins.tolist(),
+            max_point_margins.tolist(),
+        )
+    }
@@ -0,0 +1,29 @@
+"""
+Shared setup for the chart scripts in this directory.
+
+Importing this module puts the API directory on sys.path, resolves the
+season and chart base paths relative to this directory, and points the
+season loader at the season files, so each script doesn't repeat the same
+preamble.
+"""
+
+import sys
+import os
+
+# Add the API directory to the path using relative path from script location
+script_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(script_dir)
+sys.path.append(os.path.join(parent_dir, "form_nba_chart_json_data_api"))
+
+# Base paths for input and output files, as absolute paths so the scripts
+# don't depend on the working directory
+json_base_path = os.path.abspath(
+    os.path.join(script_dir, "../../../docs/frontend/source/_static/json/seasons")
+)
+chart_base_path = os.path.abspath(
+    os.path.join(script_dir, "../../../docs/frontend/source/_static/json/charts")
+)
+
+import form_nba_chart_json_data_season_game_loader as loader
+
+loader.json_base_path = json_base_path
@@ -7,17 +7,13 @@ game analysis charts. It generates both JSON data files and corresponding
 RST documentation files for various chart types.
 """
 
-import sys
 import os
 import re
+import shutil
+from concurrent.futures import ProcessPoolExecutor
 
-# Add the API directory to the path using relative path from script location
-script_dir = os.path.dirname(os.path.abspath(__file__))
-parent_dir = os.path.dirname(script_dir)
-form_nba_chart_json_data_api_dir = os.path.join(
-    parent_dir, "form_nba_chart_json_data_api"
-)
-sys.path.append(form_nba_chart_json_data_api_dir)
+# Put the API directory on sys.path and resolve the input and output paths
+from _bootstrap import script_dir, chart_base_path, loader
 
 # Import API functions
 from form_nba_chart_json_data_api import (
@@ -25,41 +21,13 @@ from form_nba_chart_json_data_api import (
     plot_percent_versus_time,
     GameFilter,
 )
+from form_nba_chart_json_data_plot_primitives import FinalPlot
 
-# Calculate script directory from __file__
-script_dir = os.path.dirname(os.path.abspath(__file__))
-print(f"Script directory: {script_dir}")
-
-# Change working directory to the script's location
-os.chdir(script_dir)
-print(f"Working directory changed to: {os.getcwd()}")
-# Base paths for input and output files
-json_base_path = "../../../docs/frontend/source/_static/json/seasons"
-chart_base_path = "../../../docs/frontend/source/_static/json/charts"
-
-import form_nba_chart_json_data_season_game_loader as loader
-
-# Convert relative json_base_path to an absolute path
-json_base_path = os.path.abspath(os.path.join(script_dir, json_base_path))
-loader.json_base_path = json_base_path
-
-
-# Clean up and recreate directories
-import shutil
-
-# Create plots directory if it doesn't exist
+# Output directories for the chart JSON files and the Sphinx pages
 plots_dir = f"{chart_base_path}/plots"
-if os.path.exists(plots_dir):
-    print(f"Removing existing plots directory: {plots_dir}")
-    shutil.rmtree(plots_dir)
-os.makedirs(plots_dir, exist_ok=True)
-
-# Clean up and recreate Sphinx directory
-sphinx_dir = "../../../docs/frontend/source/analysis/plots"
-if os.path.exists(sphinx_dir):
-    print(f"Removing existing Sphinx directory: {sphinx_dir}")
-    shutil.rmtree(sphinx_dir)
-os.makedirs(sphinx_dir, exist_ok=True)
+sphinx_dir = os.path.abspath(
+    os.path.join(script_dir, "../../../docs/frontend/source/analysis/plots")
+)
 
 
 def remove_game_count(title):
@@ -385,238 +353,216 @@ def create_plot_page(page_name, years_groups, game_filters=None):
     else:
         raise AssertionError
 
+    # Group plots by their section types
+    max_down_or_more_plots = []
+    max_down_plots = []
+    down_at_time_plots = []
+    occurs_down_or_more_plots = []
+    percent_plots = []
+
+    for plot_id, plot_title, plot_json in plot_data:
+        if "occurs_down_or_more" in plot_id:
+            occurs_down_or_more_plots.append((plot_id, plot_title, plot_json))
+        elif "max_down_or_more" in plot_id:
+            max_down_or_more_plots.append((plot_id, plot_title, plot_json))
+        elif "max_down" in plot_id:
+            max_down_plots.append((plot_id, plot_title, plot_json))
+        elif "down_at" in plot_id:
+            down_at_time_plots.append((plot_id, plot_title, plot_json))
+        elif "percent" in plot_id:
+            percent_plots.append((plot_id, plot_title, plot_json))
+
+    sections = [
+        ("Max Points Down or More", max_down_or_more_plots),
+        ("Max Points Down", max_down_plots),
+        ("Points Down At Time", down_at_time_plots),
+        ("Occurrence of Max Points Down Or More", occurs_down_or_more_plots),
+        (
+            "Percent Chance of Winning: Time Remaining Versus Points Down",
+            percent_plots,
+        ),
+    ]
+
+    # Build the RST text as a list of parts joined once at the end, with the
+    # page title in asterisks above and below
+    parts = [f"{'*' * len(rst_title)}\n{rst_title}\n{'*' * len(rst_title)}\n\n"]
+    for section_title, section_plots in sections:
+        # Write each section only if relevant plots exist
+        if not section_plots:
+            continue
+        parts.append(f"{section_title}\n{'=' * len(section_title)}\n\n")
+
+        for plot_id, plot_title, plot_json in section_plots:
+            # The subsection title and reference, then the chart div
+            div_id = plot_json[len(chart_base_path) :].lstrip("/").removesuffix(".json")
+            parts.append(
+                f"{plot_title}\n{'-' * len(plot_title)}\n\n"
+                f".. _{page_name}_{plot_id}:\n\n"
+                ".. raw:: html\n\n"
+                f'    <div id="{div_id}" class="nbacd-chart"></div>\n\n'
+            )
+
     # Create RST file
     rst_path = f"{sphinx_dir}/{page_name}.rst"
     with open(rst_path, "w") as f:
-        # Write the page title with asterisks above and below
-        f.write(f"{'*' * len(rst_title)}\n")
-        f.write(f"{rst_title}\n")
-        f.write(f"{'*' * len(rst_title)}\n\n")
-
-        # Group plots by their section types
-        max_down_or_more_plots = []
-        max_down_plots = []
-        down_at_time_plots = []
-        occurs_down_or_more_plots = []
-        percent_plots = []
-
-        for plot_id, plot_title, plot_json in plot_data:
-            if "occurs_down_or_more" in plot_id:
-                occurs_down_or_more_plots.append((plot_id, plot_title, plot_json))
-            elif "max_down_or_more" in plot_id:
-                max_down_or_more_plots.append((plot_id, plot_title, plot_json))
-            elif "max_down" in plot_id:
-                max_down_plots.append((plot_id, plot_title, plot_json))
-            elif "down_at" in plot_id:
-                down_at_time_plots.append((plot_id, plot_title, plot_json))
-            elif "percent" in plot_id:
-                percent_plots.append((plot_id, plot_title, plot_json))
-
-        # Write Max Points Down or More section if relevant plots exist
-        if max_down_or_more_plots:
-            section_title = "Max Points Down or More"
-            f.write(f"{section_title}\n")
-            f.write(f"{'=' * len(section_title)}\n\n")
-
-            for plot_id, plot_title, plot_json in max_down_or_more_plots:
-                # Write the subsection title and reference
-                f.write(f"{plot_title}\n")
-                f.write(f"{'-' * len(plot_title)}\n\n")
-                f.write(f".. _{page_name}_{plot_id}:\n\n")
-
-                # Add the chart div
-                f.write(".. raw:: html\n\n")
-                div_id = (
-                    plot_json.split(chart_base_path)[-1]
-                    .lstrip("/")
-                    .replace(".json", "")
-                )
-                f.write(f'    <div id="{div_id}" class="nbacd-chart"></div>\n\n')
-
-        # Write Max Points Down section if relevant plots exist
-        if max_down_plots:
-            section_title = "Max Points Down"
-            f.write(f"{section_title}\n")
-            f.write(f"{'=' * len(section_title)}\n\n")
-
-            for plot_id, plot_title, plot_json in max_down_plots:
-                # Write the subsection title and reference
-                f.write(f"{plot_title}\n")
-                f.write(f"{'-' * len(plot_title)}\n\n")
-                f.write(f".. _{page_name}_{plot_id}:\n\n")
-
-                # Add the chart div
-                f.write(".. raw:: html\n\n")
-                div_id = (
-                    plot_json.split(chart_base_path)[-1]
-                    .lstrip("/")
-                    .replace(".json", "")
-                )
-                f.write(f'    <div id="{div_id}" class="nbacd-chart"></div>\n\n')
-
-        # Write Points Down At Time section if relevant plots exist
-        if down_at_time_plots:
-            section_title = "Points Down At Time"
-            f.write(f"{section_title}\n")
-            f.write(f"{'=' * len(section_title)}\n\n")
-
-            for plot_id, plot_title, plot_json in down_at_time_plots:
-                # Write the subsection title and reference
-                f.write(f"{plot_title}\n")
-                f.write(f"{'-' * len(plot_title)}\n\n")
-                f.write(f".. _{page_name}_{plot_id}:\n\n")
-
-                # Add the chart div
-                f.write(".. raw:: html\n\n")
-                div_id = (
-                    plot_json.split(chart_base_path)[-1]
-                    .lstrip("/")
-                    .replace(".json", "")
-                )
-                f.write(f'    <div id="{div_id}" class="nbacd-chart"></div>\n\n')
-
-        # Write Occurrence of Max Points Down Or More section if relevant plots exist
-        if occurs_down_or_more_plots:
-            section_title = "Occurrence of Max Points Down Or More"
-            f.write(f"{section_title}\n")
-            f.write(f"{'=' * len(section_title)}\n\n")
-
-            for plot_id, plot_title, plot_json in occurs_down_or_more_plots:
-                # Write the subsection title and reference
-                f.write(f"{plot_title}\n")
-                f.write(f"{'-' * len(plot_title)}\n\n")
-                f.write(f".. _{page_name}_{plot_id}:\n\n")
-
-                # Add the chart div
-                f.write(".. raw:: html\n\n")
-                div_id = (
-                    plot_json.split(chart_base_path)[-1]
-                    .lstrip("/")
-                    .replace(".json", "")
-                )
-                f.write(f'    <div id="{div_id}" class="nbacd-chart"></div>\n\n')
-
-        # Write Percent Chance section if relevant plots exist
-        if percent_plots:
-            section_title = (
-                "Percent Chance of Winning: Time Remaining Versus Points Down"
-            )
-            f.write(f"{section_title}\n")
-            f.write(f"{'=' * len(section_title)}\n\n")
-
-            for plot_id, plot_title, plot_json in percent_plots:
-                # Write the subsection title and reference
-                f.write(f"{plot_title}\n")
-                f.write(f"{'-' * len(plot_title)}\n\n")
-                f.write(f".. _{page_name}_{plot_id}:\n\n")
-
-                # Add the chart div
-                f.write(".. raw:: html\n\n")
-                div_id = (
-                    plot_json.split(chart_base_path)[-1]
-                    .lstrip("/")
-                    .replace(".json", "")
-                )
-                f.write(f'    <div id="{div_id}" class="nbacd-chart"></div>\n\n')
-
-    # Update index.rst to include this page
-    index_rst_path = f"{sphinx_dir}/index.rst"
-    with open(index_rst_path, "a") as f:
-        f.write(f"   {page_name}\n")
-
-
-# Create index.rst file first
-create_index_rst_file(sphinx_dir)
-
-# Create all the plot pages
-create_plot_page("all_time_v_modern", years_groups=[(1996, 2024), (2017, 2024)])
-create_plot_page("old_school_v_modern", years_groups=[(1996, 2016), (2017, 2024)])
-create_plot_page(
-    "old_old_school_v_old_school", years_groups=[(1996, 2006), (2007, 2016)]
-)
-create_plot_page(
-    "new_school_v_new_new_school", years_groups=[(2017, 2020), (2021, 2024)]
-)
-
-create_plot_page(
-    "modern_top_5_v_bot_5",
-    years_groups=[(2017, 2024)],
-    game_filters=[
-        GameFilter(),
-        GameFilter(for_rank="top_5", vs_rank="bot_5"),
-        GameFilter(for_rank="bot_5", vs_rank="top_5"),
-    ],
-)
+        f.write("".join(parts))
 
-create_plot_page(
-    "modern_top_10_v_bot_10",
-    years_groups=[(2017, 2024)],
-    game_filters=[
-        GameFilter(),
-        GameFilter(for_rank="top_10", vs_rank="bot_10"),
-        GameFilter(for_rank="bot_10", vs_rank="top_10"),
-    ],
-)
 
-create_plot_page(
-    "modern_top_10_v_mid_10",
-    years_groups=[(2017, 2024)],
-    game_filters=[
-        GameFilter(),
-        GameFilter(for_rank="top_10", vs_rank="mid_10"),
-        GameFilter(for_rank="mid_10", vs_rank="top_10"),
-    ],
-)
-
-create_plot_page(
-    "modern_bot_10_v_mid_10",
-    years_groups=[(2017, 2024)],
-    game_filters=[
-        GameFilter(),
-        GameFilter(for_rank="bot_10", vs_rank="mid_10"),
-        GameFilter(for_rank="mid_10", vs_rank="bot_10"),
-    ],
-)
-
-create_plot_page(
-    "modern_home_v_away",
-    years_groups=[(2017, 2024)],
-    game_filters=[
-        GameFilter(),
-        GameFilter(for_at_home=True),
-        GameFilter(for_at_home=False),
-    ],
-)
-
-create_plot_page(
-    "recent_min_versus",
-    years_groups=[(2021, 2024)],
-    game_filters=[
-        GameFilter(),
-        GameFilter(for_team_abbr="MIN"),
-        GameFilter(vs_team_abbr="MIN"),
-    ],
-)
-
-create_plot_page(
-    "recent_min_comes_back_at_home_versus_away",
-    years_groups=[(2021, 2024)],
-    game_filters=[
-        GameFilter(),
-        GameFilter(for_team_abbr="MIN", for_at_home=False),
-        GameFilter(for_team_abbr="MIN", for_at_home=True),
-    ],
-)
-
-create_plot_page(
-    "recent_min_gives_away_leads_at_home_versus_away",
-    years_groups=[(2021, 2024)],
-    game_filters=[
-        GameFilter(),
-        GameFilter(vs_team_abbr="MIN", for_at_home=False),
-        GameFilter(vs_team_abbr="MIN", for_at_home=True),
-    ],
-)
+def create_plot_page_and_wait(page):
+    """
+    Create one plot page in a worker process.
 
+    Worker processes exit without running atexit handlers, so wait here for
+    the page's chart files to be written.
 
-print("All plot pages and RST files have been created successfully!")
+    Parameters:
+    -----------
+    page : dict
+        Keyword arguments for create_plot_page
+    """
+    create_plot_page(**page)
+    FinalPlot.join_all()
+
+
+# Unfiltered games, shared by the filtered pages below
+ALL_GAMES = GameFilter()
+
+# Season ranges (eras) used by the pages below
+ERA_96_24 = (1996, 2024)
+ERA_96_16 = (1996, 2016)
+ERA_96_06 = (1996, 2006)
+ERA_07_16 = (2007, 2016)
+ERA_17_24 = (2017, 2024)
+ERA_17_20 = (2017, 2020)
+ERA_21_24 = (2021, 2024)
+
+# Every plot page, in index order
+PLOT_PAGES = [
+    dict(
+        page_name="all_time_v_modern",
+        years_groups=[ERA_96_24, ERA_17_24],
+    ),
+    dict(
+        page_name="old_school_v_modern",
+        years_groups=[ERA_96_16, ERA_17_24],
+    ),
+    dict(
+        page_name="old_old_school_v_old_school",
+        years_groups=[ERA_96_06, ERA_07_16],
+    ),
+    dict(
+        page_name="new_school_v_new_new_school",
+        years_groups=[ERA_17_20, ERA_21_24],
+    ),
+    dict(
+        page_name="modern_top_5_v_bot_5",
+        years_groups=[ERA_17_24],
+        game_filters=[
+            ALL_GAMES,
+            GameFilter(for_rank="top_5", vs_rank="bot_5"),
+            GameFilter(for_rank="bot_5", vs_rank="top_5"),
+        ],
+    ),
+    dict(
+        page_name="modern_top_10_v_bot_10",
+        years_groups=[ERA_17_24],
+        game_filters=[
+            ALL_GAMES,
+            GameFilter(for_rank="top_10", vs_rank="bot_10"),
+            GameFilter(for_rank="bot_10", vs_rank="top_10"),
+        ],
+    ),
+    dict(
+        page_name="modern_top_10_v_mid_10",
+        years_groups=[ERA_17_24],
+        game_filters=[
+            ALL_GAMES,
+            GameFilter(for_rank="top_10", vs_rank="mid_10"),
+            GameFilter(for_rank="mid_10", vs_rank="top_10"),
+        ],
+    ),
+    dict(
+        page_name="modern_bot_10_v_mid_10",
+        years_groups=[ERA_17_24],
+        game_filters=[
+            ALL_GAMES,
+            GameFilter(for_rank="bot_10", vs_rank="mid_10"),
+            GameFilter(for_rank="mid_10", vs_rank="bot_10"),
+        ],
+    ),
+    dict(
+        page_name="modern_home_v_away",
+        years_groups=[ERA_17_24],
+        game_filters=[
+            ALL_GAMES,
+            GameFilter(for_at_home=True),
+            GameFilter(for_at_home=False),
+        ],
+    ),
+    dict(
+        page_name="recent_min_versus",
+        years_groups=[ERA_21_24],
+        game_filters=[
+            ALL_GAMES,
+            GameFilter(for_team_abbr="MIN"),
+            GameFilter(vs_team_abbr="MIN"),
+        ],
+    ),
+    dict(
+        page_name="recent_min_comes_back_at_home_versus_away",
+        years_groups=[ERA_21_24],
+        game_filters=[
+            ALL_GAMES,
+            GameFilter(for_team_abbr="MIN", for_at_home=False),
+            GameFilter(for_team_abbr="MIN", for_at_home=True),
+        ],
+    ),
+    dict(
+        page_name="recent_min_gives_away_leads_at_home_versus_away",
+        years_groups=[ERA_21_24],
+        game_filters=[
+            ALL_GAMES,
+            GameFilter(vs_team_abbr="MIN", for_at_home=False),
+            GameFilter(vs_team_abbr="MIN", for_at_home=True),
+        ],
+    ),
+]
+
+
+def main():
+    # Create plots directory if it doesn't exist
+    if os.path.exists(plots_dir):
+        print(f"Removing existing plots directory: {plots_dir}")
+        shutil.rmtree(plots_dir)
+    os.makedirs(plots_dir, exist_ok=True)
+
+    # Clean up and recreate Sphinx directory
+    if os.path.exists(sphinx_dir):
+        print(f"Removing existing Sphinx directory: {sphinx_dir}")
+        shutil.rmtree(sphinx_dir)
+    os.makedirs(sphinx_dir, exist_ok=True)
+
+    # Every era lies within ERA_96_24, so load all of its seasons in one
+    # parallel pass up front instead of one smaller pass per era; this also
+    # writes the columns caches the page workers load their seasons from
+    loader.Season.bulk_load(range(ERA_96_24[0], ERA_96_24[1] + 1))
+
+    # Create index.rst file first
+    create_index_rst_file(sphinx_dir)
+
+    # The pages are independent, so build them in parallel worker processes.
+    # run-python.sh runs this script beside the others and sets NBACD_WORKERS
+    # to its share of the CPUs, so the pool doesn't oversubscribe them
+    max_workers = int(os.environ.get("NBACD_WORKERS", 0)) or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=min(len(PLOT_PAGES), max_workers)) as pool:
+        list(pool.map(create_plot_page_and_wait, PLOT_PAGES))
+
+    # Add the pages to index.rst in order once they all exist
+    with open(f"{sphinx_dir}/index.rst", "a") as f:
+        f.write("".join(f"   {page['page_name']}\n" for page in PLOT_PAGES))
+
+    print("All plot pages and RST files have been created successfully!")
+
+
+if __name__ == "__main__":
+    main()
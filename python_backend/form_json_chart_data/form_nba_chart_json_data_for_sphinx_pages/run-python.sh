@@ -1,6 +1,69 @@
 #!/bin/bash
 
-for file in $(find . -name "*.py"); do
-  echo "Running $file..."
-  python3 "$file"
-done
\ No newline at end of file
+# Scripts are skipped when their last successful run is newer than the
+# script, the API and the season files; pass --force to run them all
+if [ "$1" = "--force" ]; then
+  find . -name ".*.stamp" -delete
+fi
+export SEASONS_DIR="../../../docs/frontend/source/_static/json/seasons"
+
+# Parse each season file once up front, so the scripts below all load the
+# seasons from their caches instead of each parsing the same files. Stop
+# here if that fails, rather than have every script report the same error
+if ! (
+  cd ../form_nba_chart_json_data_api &&
+    python3 -c '
+import form_nba_chart_json_data_season_game_loader as loader
+
+loader.json_base_path = "../../../docs/frontend/source/_static/json/seasons"
+loader.warm_season_caches()
+'
+); then
+  echo "Season cache warm-up failed; not running the scripts" >&2
+  exit 1
+fi
+
+# The scripts are independent and each writes its own chart files, so run
+# them in parallel, one per CPU. Each script's output is collected and
+# printed in one block so parallel runs don't interleave, and a one-line
+# result per script is summarized at the end.
+export SUMMARY_FILE="$(mktemp)"
+# Scripts with their own worker pool (the plots page) get an equal share of
+# the CPUs rather than all of them, since the other scripts run beside them
+ncpu="$(getconf _NPROCESSORS_ONLN)"
+nscripts="$(find . -name "*.py" ! -name "_*" | wc -l)"
+export NBACD_WORKERS=$((ncpu / nscripts > 1 ? ncpu / nscripts : 1))
+# (_bootstrap.py is shared setup imported by the scripts, not a script)
+find . -name "*.py" ! -name "_*" -print0 |
+  xargs -0 -n 1 -P "$ncpu" \
+    sh -c '
+      stamp="$(dirname "$0")/.$(basename "$0").stamp"
+      if [ -e "$stamp" ] && [ -z "$(
+        find "$0" ./_bootstrap.py ../form_nba_chart_json_data_api "$SEASONS_DIR" \
+          \( -name "*.py" -o -name "*.json.gz" \) -newer "$stamp" | head -n 1
+      )" ]; then
+        echo "$0: skipped (up to date)" >>"$SUMMARY_FILE"
+        exit 0
+      fi
+      touch "$stamp.new"
+      start=$(date +%s)
+      output="$(python3 "$0" 2>&1)"
+      status=$?
+      elapsed=$(($(date +%s) - start))
+      printf "==> %s (%ss)\n%s\n" "$0" "$elapsed" "$output"
+      echo "$0: exit $status in ${elapsed}s" >>"$SUMMARY_FILE"
+      # Only a clean exit marks the script up to date; the FinalPlot exit hook
+      # makes a script whose chart writes failed exit non-zero
+      if [ $status -eq 0 ]; then
+        mv "$stamp.new" "$stamp"
+      else
+        rm -f "$stamp.new"
+      fi
+      exit $status
+    '
+status=$?
+
+echo "Summary:"
+sort "$SUMMARY_FILE"
+rm -f "$SUMMARY_FILE"
+exit $status
@@ -33,20 +33,26 @@ import form_nba_chart_json_data_season_game_loader as loader
 json_base_path = os.path.abspath(os.path.join(script_dir, json_base_path))
 loader.json_base_path = json_base_path
 
-base_path = f"{chart_base_path}/thumb"
-# Control which plots to generate
-plot_all = True
-
-eras_one = [
-    # ERA ONE
-    (1996, 2024),
-    # (2017, 2024),
-]
-
-plot_biggest_deficit(
-    json_name=None,
-    year_groups=eras_one,
-    start_time=24,
-    stop_time=None,
-    cumulate=True,
-)
+
+def main():
+    base_path = f"{chart_base_path}/thumb"
+    # Control which plots to generate
+    plot_all = True
+
+    eras_one = [
+        # ERA ONE
+        (1996, 2024),
+        # (2017, 2024),
+    ]
+
+    plot_biggest_deficit(
+        json_name=None,
+        year_groups=eras_one,
+        start_time=24,
+        stop_time=None,
+        cumulate=True,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,20 @@
 # Standard library imports
+import base64
+import gzip
 import json
 import sqlite3
+import struct
 from collections import OrderedDict, defaultdict
 
 # Third-party imports
 from scipy.interpolate import interp1d
 
+try:
+    # orjson serializes the season data several times faster than the stdlib
+    import orjson
+except ImportError:
+    orjson = None
+
 
 def dict_factory(cursor, row):
     """Convert database row objects to dictionaries."""
@@ -217,14 +226,19 @@ class Games:
         # Make sure filename ends with .gz
         if not filename.endswith(".gz"):
             filename = filename + ".gz"
-        if filename.endswith(".gz"):
-            import gzip
-
-            with gzip.open(filename, "wt") as f:
-                json.dump(season_data, f, indent=2)
+        if orjson is not None:
+            # Non-string keys are stringified, as json.dumps does
+            payload = orjson.dumps(
+                season_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            )
         else:
-            with open(filename, "w") as f:
-                json.dump(season_data, f, indent=2)
+            payload = json.dumps(season_data, indent=2).encode("utf-8")
+        if filename.endswith(".gz"):
+            # Compress the whole payload in one call rather than streaming it
+            # through a text-mode GzipFile
+            payload = gzip.compress(payload)
+        with open(filename, "wb") as f:
+            f.write(payload)
 
         print(f"Saved {len(season_data['games'])} games to {filename}")
 
@@ -275,10 +289,14 @@ class Game:
             "home_team_abbr": self.home_team_abbr,
             "away_team_abbr": self.away_team_abbr,
             "score": self.score,
-            "point_margins": self.score_stats_by_minute.point_margins,
+            "point_margins_bin": self.score_stats_by_minute.point_margins_bin,
         }
 
 
+# (index, point_margin, min_point_margin, max_point_margin) binary record
+POINT_MARGIN_RECORD = struct.Struct("<Bhhh")
+
+
 class ScoreStat:
     """Statistics for score at a given point in the game."""
 
@@ -350,6 +368,21 @@ class ScoreStatsByMinute:
                 margins.append(f"{index}={points},{min_points},{max_points}")
         return margins
 
+    @property
+    def point_margins_bin(self):
+        """
+        Point margins as base64 of packed little-endian records.
+
+        Each time index with data is one 7-byte "<Bhhh" record of
+        (index, point_margin, min_point_margin, max_point_margin), so the
+        loader can decode a whole season with a single np.frombuffer call.
+        """
+        records = b"".join(
+            POINT_MARGIN_RECORD.pack(index, *score_stat.values())
+            for index, score_stat in sorted(self.scores_map.items())
+        )
+        return base64.b64encode(records).decode("ascii")
+
 
 class PlayByPlays:
     """Collection of play-by-play events for a game."""
@@ -210,6 +210,8 @@ def get_game_row(game_id, gate_data, season_year, season_type):
 
 game_count = 0
 now = datetime.datetime(2025, 9, 1)
+# GAME_DATE is ISO-8601 "YYYY-MM-DD", so dates compare correctly as strings
+now_date_string = now.strftime("%Y-%m-%d")
 season_types = ["Regular Season", "Playoffs", "Playin"]
 # season_types = ["Playoffs"]
 # season_types = ["Regular Season"]
@@ -262,8 +264,7 @@ for year in range(1996, 2025):
         games = {}
         for row in games_df.iterrows():
             game = dict(row[1])
-            date = datetime.datetime.strptime(game["GAME_DATE"], "%Y-%m-%d")
-            if date >= now:
+            if game["GAME_DATE"] >= now_date_string:
                 continue
             games.setdefault(game["GAME_ID"], []).append(game)
 